@@ -71,6 +71,9 @@ class HubSpotFieldFilter:
         self.OTHER_READONLY_PREFIXES = {
             'num_', 'first_', 'recent_', 'last_', 'total_'
         }
+        
+        # Verdicts by property name; the same names recur on every record in a sync
+        self._name_writable_cache: Dict[str, bool] = {}
     
     def is_writable_property(self, prop: Dict[str, Any]) -> bool:
         """
@@ -166,6 +169,13 @@ class HubSpotFieldFilter:
         Returns:
             True if property name suggests it's writable
         """
+        writable = self._name_writable_cache.get(prop_name)
+        if writable is None:
+            writable = self._name_writable_cache[prop_name] = self._check_property_name_writable(prop_name)
+        return writable
+    
+    def _check_property_name_writable(self, prop_name: str) -> bool:
+        """Uncached rules behind is_property_name_writable"""
         prop_name_lower = prop_name.lower()
         
         # Skip exact readonly field names
@@ -290,6 +300,9 @@ class DealFieldFilter:
             'num_', 'first_', 'recent_', 'last_', 'total_', 'count_',
             'days_', 'closed_', 'hs_closed_', 'hs_days_'
         }
+        
+        # Verdicts by property name; the same names recur on every record in a sync
+        self._name_writable_cache: Dict[str, bool] = {}
     
     def is_writable_deal_property(self, prop: Dict[str, Any]) -> bool:
         """
@@ -425,6 +438,13 @@ class DealFieldFilter:
         Returns:
             True if property name suggests it's writable
         """
+        writable = self._name_writable_cache.get(prop_name)
+        if writable is None:
+            writable = self._name_writable_cache[prop_name] = self._check_property_name_writable(prop_name)
+        return writable
+    
+    def _check_property_name_writable(self, prop_name: str) -> bool:
+        """Uncached rules behind is_property_name_writable"""
         prop_name_lower = prop_name.lower()
         
         # Core deal fields are always writable
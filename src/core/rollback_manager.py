@@ -8,7 +8,7 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from utils.utils import load_env_config, get_api_headers, make_hubspot_request
+from utils.utils import load_env_config, get_api_headers, make_hubspot_request, json_loads
 import json
 import glob
 import time
@@ -39,8 +39,8 @@ class RollbackManager:
         for pattern in patterns:
             for file_path in glob.glob(pattern):
                 try:
-                    with open(file_path, 'r') as f:
-                        report = json.load(f)
+                    with open(file_path, 'rb') as f:
+                        report = json_loads(f.read())
                     
                     report_date = datetime.fromisoformat(report.get('migration_date', '1970-01-01'))
                     
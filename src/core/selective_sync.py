@@ -8,20 +8,121 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from utils.utils import load_env_config, get_api_headers, make_hubspot_request
-from migrations.contact_migration import migrate_contacts
-from migrations.deal_migrator import DealMigrator
-from migrations.deal_association_migrator import DealAssociationMigrator
+from utils.utils import (
+    load_env_config, get_api_headers, make_hubspot_request, create_hubspot_session, get_rate_limiter,
+    json_dumps
+)
+from migrations.contact_migration import (
+    create_contact_in_sandbox, update_contact_in_sandbox, get_contact_display_name
+)
 from core.field_filters import HubSpotFieldFilter
 import time
-import json
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Set
+import logging
+import threading
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Set, Iterator
+
+logger = logging.getLogger(__name__)
+
+# HubSpot batch endpoints accept at most 100 inputs per request
+BATCH_SIZE = 100
+
+# The v4 associations batch read accepts up to 1000 inputs per request
+ASSOCIATION_READ_BATCH_SIZE = 1000
+
+# Records migrated concurrently per step; request pacing is left to the per-portal rate limiters
+MAX_WORKERS = 8
+
+# Most list pages read to index existing sandbox records; larger sandboxes are matched with searches
+SANDBOX_INDEX_MAX_PAGES = 10
+
+# Fallback contact properties when the property schema cannot be fetched
+BASIC_CONTACT_PROPERTIES = ['email', 'firstname', 'lastname', 'createdate']
+
+# Deal properties read when selecting deals to sync
+BASIC_DEAL_PROPERTIES = ['dealname', 'amount', 'pipeline', 'dealstage', 'createdate']
+
+# Query-string form of the above for GET endpoints, joined once at import
+_BASIC_DEAL_PROPERTIES_PARAM = ','.join(BASIC_DEAL_PROPERTIES)
+
+# Comprehensive list of commonly safe company properties
+SAFE_COMPANY_PROPERTIES = (
+    'name', 'domain', 'city', 'state', 'country', 'industry', 'phone', 'website',
+    'description', 'founded_year', 'is_public', 'timezone', 'type', 'zip',
+    'address', 'address2', 'annualrevenue', 'numberofemployees', 'owneremail',
+    'facebookcompanypage', 'linkedincompanypage', 'twitterhandle',
+    'googleplus_page', 'about_us', 'facebook_company_page'
+)
+
+# Common deal properties that are usually safe
+SAFE_DEAL_PROPERTIES = ('dealname', 'amount', 'dealstage', 'pipeline', 'closedate', 'createdate')
+
+# HubSpot-defined association type names for the v3 associations API
+ASSOCIATION_TYPES = {
+    ('contacts', 'deals'): 'contact_to_deal',
+    ('deals', 'contacts'): 'deal_to_contact',
+    ('contacts', 'companies'): 'contact_to_company',
+    ('companies', 'contacts'): 'company_to_contact',
+    ('companies', 'deals'): 'company_to_deal',
+    ('deals', 'companies'): 'deal_to_company'
+}
+
+# Common words to ignore in company names
+COMPANY_STOP_WORDS = frozenset({
+    'inc', 'llc', 'ltd', 'corp', 'corporation', 'company', 'co', 'group',
+    'the', 'and', 'of', 'for', 'in', 'on', 'at', 'to', 'a', 'an', 'is', 'are',
+    'services', 'service', 'solutions', 'enterprises', 'international', 'global'
+})
+
+_DOMAIN_PREFIX = re.compile(r'^(?:https?://)?(?:www\.)?')
+_NON_DIGIT = re.compile(r'\D+')
+_KEEP_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+@lru_cache(maxsize=4096)
+def _normalize_domain(domain: str) -> str:
+    """Lowercase a domain and strip protocol, www, path and port"""
+    normalized = _DOMAIN_PREFIX.sub('', domain.lower().strip())
+    return normalized.split('/', 1)[0].split(':', 1)[0]
+
+def _days_ago_ms(days: float) -> int:
+    """Epoch milliseconds (as HubSpot expects) for the moment the given number of days ago"""
+    return int((time.time() - days * 86400) * 1000)
+
+@lru_cache(maxsize=4096)
+def _normalize_phone(phone: str) -> str:
+    """Reduce a phone number to its digits, dropping a leading US country code"""
+    # translate() runs entirely in C for ASCII input; the regex also handles non-ASCII digits
+    digits_only = phone.translate(_KEEP_DIGITS) if phone.isascii() else _NON_DIGIT.sub('', phone)
+    return digits_only[1:] if len(digits_only) == 11 and digits_only[0] == '1' else digits_only
+
+@lru_cache(maxsize=8192)
+def _name_tokens(normalized_name: str) -> frozenset:
+    """Token set of a normalized company name, cached since candidates recur across lookups"""
+    return frozenset(normalized_name.split())
 
 class SelectiveSyncManager:
     def __init__(self, prod_token: str, sandbox_token: str):
         self.prod_token = prod_token
         self.sandbox_token = sandbox_token
+        
+        # One pooled session per portal so connections are reused across requests
+        self._prod_headers = get_api_headers(prod_token)
+        self._sandbox_headers = get_api_headers(sandbox_token)
+        self._prod_session = create_hubspot_session(prod_token)
+        self._sandbox_session = create_hubspot_session(sandbox_token)
+        
+        # Worker pool for concurrent requests, created on first use and reused for the whole sync
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._worker_state = threading.local()
+        
+        # HubSpot rate limits apply per token, so each portal shares its token's limiter
+        self._prod_limiter = get_rate_limiter(prod_token)
+        self._sandbox_limiter = get_rate_limiter(sandbox_token)
+        
         self.sync_metadata = {
             'sync_date': datetime.now().isoformat(),
             'sync_type': '',
@@ -34,10 +135,57 @@ class SelectiveSyncManager:
             'associations_created': [],
             'properties_synced': []
         }
+        
+        # Related objects already fetched during this sync, keyed by object ID
+        self._company_cache: Dict[str, Dict] = {}
+        self._contact_cache: Dict[str, Dict] = {}
+        self._deal_cache: Dict[str, Dict] = {}
+        
+        # Sandbox IDs of records created (not updated) during this sync
+        self._created_sandbox_ids: Dict[str, List[str]] = {'contacts': [], 'companies': [], 'deals': []}
+        
+        # In-memory lookup indexes of existing sandbox records, rebuilt at the start of each
+        # migration step; None means the listing failed and lookups fall back to search
+        self._company_index: Optional[Dict[str, Any]] = None
+        self._deal_index: Optional[Dict[str, List[tuple]]] = None
+        
+        # Exact-match company searches made when the index is unavailable, (property, value) → ID
+        self._company_search_cache: Dict[tuple, Optional[str]] = {}
+        
+        # Production → sandbox IDs, filled in as contacts and companies are migrated
+        self._contact_id_mapping: Dict[str, str] = {}
+        self._company_id_mapping: Dict[str, str] = {}
+        
+        # (from type, to type) → production object ID → associated IDs, read once per sync
+        self._association_cache: Dict[tuple, Dict[str, List[str]]] = {}
+        
+        # (from type, to type) → v4 association type ID, looked up on first use
+        self._association_type_ids: Dict[tuple, Optional[int]] = {}
+        
+        # Company updates waiting to be sent in one batch update call
+        self._pending_company_updates: List[Dict] = []
+        
+        # Contact property schema is loaded lazily and reused for the whole sync
+        self._field_filter = HubSpotFieldFilter()
+        self._safe_contact_props: Optional[List[str]] = None
+        self._sandbox_safe_contact_props: Optional[List[str]] = None
+    
+    def _prod_request(self, method: str, url: str, **kwargs):
+        """Make a rate-limited request against the production portal over its pooled session"""
+        return make_hubspot_request(
+            method, url, self._prod_headers, session=self._prod_session, rate_limiter=self._prod_limiter, **kwargs
+        )
+    
+    def _sandbox_request(self, method: str, url: str, **kwargs):
+        """Make a rate-limited request against the sandbox portal over its pooled session"""
+        return make_hubspot_request(
+            method, url, self._sandbox_headers, session=self._sandbox_session, rate_limiter=self._sandbox_limiter, **kwargs
+        )
     
     def get_contacts_by_criteria(self, criteria: Dict[str, Any]) -> List[Dict]:
         """Get contacts based on various criteria ordered by creation date DESC (newest first)"""
-        headers = get_api_headers(self.prod_token)
+        # Request the full safe property list up front so no second fetch pass is needed
+        contact_props = self._get_safe_contact_props() or BASIC_CONTACT_PROPERTIES
         
         # Priority 1: Specific contact IDs
         if 'contact_ids' in criteria and criteria['contact_ids']:
@@ -47,18 +195,13 @@ class SelectiveSyncManager:
         # Priority 2: Email domain filtering
         elif 'email_domains' in criteria and criteria['email_domains']:
             print(f"📧 Fetching contacts by email domains: {criteria['email_domains']}")
-            return self._fetch_contacts_by_email_domains(criteria['email_domains'], criteria.get('limit'))
+            return self._fetch_contacts_by_email_domains(criteria['email_domains'], criteria.get('limit'), contact_props)
         
         # Priority 3: Date filtering  
         elif 'days_since_created' in criteria:
-            from datetime import datetime, timedelta
-            
-            # Calculate the date threshold
-            days_back = criteria['days_since_created']
-            threshold_date = datetime.now() - timedelta(days=days_back)
-            threshold_timestamp = int(threshold_date.timestamp() * 1000)  # HubSpot uses milliseconds
+            threshold_timestamp = _days_ago_ms(criteria['days_since_created'])
             
-            # Use search API for date filtering (only get basic info first)
+            # Use search API for date filtering
             url = 'https://api.hubapi.com/crm/v3/objects/contacts/search'
             
             payload = {
@@ -70,74 +213,50 @@ class SelectiveSyncManager:
                     }]
                 }],
                 'sorts': [{'propertyName': 'createdate', 'direction': 'DESCENDING'}],
-                'properties': ['email', 'firstname', 'lastname', 'createdate', 'hs_object_id'],
-                'limit': criteria.get('limit', 50)
+                'properties': contact_props
             }
             
-            success, data = make_hubspot_request('POST', url, headers, json_data=payload)
-            
-            if success:
-                basic_contacts = data.get('results', [])
-                print(f"📊 Date filter: Found {len(basic_contacts)} contacts created in last {criteria.get('days_since_created', 'all')} days")
-                
-                # Now fetch full contact data with all properties
-                if basic_contacts:
-                    print(f"📋 Fetching full contact properties...")
-                    full_contacts = self._fetch_full_contact_properties(basic_contacts)
-                    return full_contacts
-                else:
-                    return basic_contacts
-            else:
-                print(f"❌ Error fetching contacts by date: {data}")
-                return []
+            # Page through the server-side filtered results up to the requested limit
+            contacts = [
+                record
+                for page_results in self._iter_search_pages(url, payload, criteria.get('limit', 50))
+                for record in page_results
+            ]
+            print(f"📊 Date filter: Found {len(contacts)} contacts created in last {criteria.get('days_since_created', 'all')} days")
+            return contacts
         
         # Priority 4: General query with limit
         else:
-            # Use simple GET API with pagination, ordered by creation date descending
-            url = 'https://api.hubapi.com/crm/v3/objects/contacts'
-            params = {
-                'properties': 'email,firstname,lastname,createdate,hs_object_id',
-                'limit': criteria.get('limit', 50),
-                'sorts': 'createdate:desc'  # Order by creation date descending (newest first)
+            # Unfiltered search sorted server-side by creation date descending (newest first),
+            # following the paging cursor up to the limit
+            url = 'https://api.hubapi.com/crm/v3/objects/contacts/search'
+            payload = {
+                'sorts': [{'propertyName': 'createdate', 'direction': 'DESCENDING'}],
+                'properties': contact_props
             }
             
-            success, data = make_hubspot_request('GET', url, headers, params=params)
-            
-            if success:
-                basic_contacts = data.get('results', [])
-                print(f"📊 General query: Found {len(basic_contacts)} contacts (limit: {criteria.get('limit', 50)})")
-                
-                # Now fetch full contact data with all properties
-                if basic_contacts:
-                    print(f"📋 Fetching full contact properties...")
-                    full_contacts = self._fetch_full_contact_properties(basic_contacts)
-                    return full_contacts
-                else:
-                    return basic_contacts
-            else:
-                print(f"❌ Error fetching contacts: {data}")
-                return []
+            contacts = [
+                contact
+                for page_results in self._iter_search_pages(url, payload, criteria.get('limit', 50))
+                for contact in page_results
+            ]
+            print(f"📊 General query: Found {len(contacts)} contacts (limit: {criteria.get('limit', 50)})")
+            return contacts
     
     def _fetch_contacts_by_ids(self, contact_ids: List[str]) -> List[Dict]:
         """Fetch specific contacts by their IDs"""
         contacts = []
-        headers = get_api_headers(self.prod_token)
+        fetched = {
+            str(contact['id']): contact
+            for contact in self._batch_read_objects('contacts', contact_ids, BASIC_CONTACT_PROPERTIES)
+        }
         
         for contact_id in contact_ids:
-            contact_url = f'https://api.hubapi.com/crm/v3/objects/contacts/{contact_id}'
-            params = {
-                'properties': 'email,firstname,lastname,createdate,hs_object_id'
-            }
-            
-            success, contact_data = make_hubspot_request('GET', contact_url, headers, params=params)
-            
-            if success:
-                contacts.append(contact_data)
-                print(f"  ✅ Fetched contact {contact_id}")
+            if str(contact_id) in fetched:
+                contacts.append(fetched[str(contact_id)])
+                logger.debug("✅ Fetched contact %s", contact_id)
             else:
-                print(f"  ❌ Failed to fetch contact {contact_id}: {contact_data}")
-            
-            time.sleep(0.1)  # Rate limiting
+                print(f"  ❌ Failed to fetch contact {contact_id}")
         
         # Now fetch full properties for all found contacts
         if contacts:
@@ -147,9 +266,9 @@ class SelectiveSyncManager:
         
         return contacts
     
-    def _fetch_contacts_by_email_domains(self, email_domains: List[str], limit: int = None) -> List[Dict]:
+    def _fetch_contacts_by_email_domains(self, email_domains: List[str], limit: Optional[int] = None,
+                                         properties: Optional[List[str]] = None) -> List[Dict]:
         """Fetch contacts by email domains using search API with pagination to get ALL results"""
-        headers = get_api_headers(self.prod_token)
         url = 'https://api.hubapi.com/crm/v3/objects/contacts/search'
         
         # Build OR filters for each email domain
@@ -161,73 +280,67 @@ class SelectiveSyncManager:
                 'value': f'@{domain.strip().lstrip("@")}'
             })
         
+        payload = {
+            'filterGroups': [{
+                'filters': filters
+            }],
+            'sorts': [{'propertyName': 'createdate', 'direction': 'DESCENDING'}],
+            'properties': properties or BASIC_CONTACT_PROPERTIES
+        }
+        
         all_contacts = []
+        for page, page_results in enumerate(self._iter_search_pages(url, payload, limit), 1):
+            all_contacts.extend(page_results)
+            print(f"📊 Page {page}: Found {len(page_results)} contacts (Total so far: {len(all_contacts)})")
+        
+        # Trim to exact limit if specified
+        if limit is not None and len(all_contacts) > limit:
+            all_contacts = all_contacts[:limit]
+        
+        print(f"📊 Email domain filter: Found {len(all_contacts)} total contacts with domains {email_domains}")
+        return all_contacts
+    
+    def _iter_search_pages(self, url: str, payload: Dict[str, Any], limit: Optional[int] = None,
+                           sandbox: bool = False) -> Iterator[List[Dict]]:
+        """Yield pages of search results, following the paging cursor until exhausted or limit is reached"""
+        request = self._sandbox_request if sandbox else self._prod_request
+        max_per_page = 100  # HubSpot max limit per request (but Search API might default to 50)
+        fetched = 0
         after = None
         page = 1
-        max_per_page = 100  # HubSpot max limit per request (but Search API might default to 50)
         
         # If limit is specified, use it; otherwise get all results
-        total_limit = limit if limit else float('inf')
-        
-        while len(all_contacts) < total_limit:
+        while limit is None or fetched < limit:
             # Calculate how many to fetch in this request
-            current_limit = min(max_per_page, total_limit - len(all_contacts)) if limit else max_per_page
-            
-            # HubSpot search API payload
-            payload = {
-                'filterGroups': [{
-                    'filters': filters
-                }],
-                'sorts': [{'propertyName': 'createdate', 'direction': 'DESCENDING'}],
-                'properties': ['email', 'firstname', 'lastname', 'createdate', 'hs_object_id'],
-                'limit': int(current_limit)
-            }
+            remaining = limit - fetched if limit is not None else max_per_page
+            page_payload = dict(payload, limit=min(max_per_page, remaining))
             
             # Add pagination token if we have one
             if after:
-                payload['after'] = after
+                page_payload['after'] = after
             
-            success, data = make_hubspot_request('POST', url, headers, json_data=payload)
+            success, data = request('POST', url, json_data=page_payload)
             
-            if success:
-                page_results = data.get('results', [])
-                all_contacts.extend(page_results)
-                
-                print(f"📊 Page {page}: Found {len(page_results)} contacts (Total so far: {len(all_contacts)})")
-                
-                # Check if there are more results
-                paging = data.get('paging', {})
-                next_page = paging.get('next', {})
-                after = next_page.get('after') if next_page else None
-                
-                # Break if no more results or we've hit our limit
-                if not after or len(page_results) == 0:
-                    break
-                
-                page += 1
-                time.sleep(0.2)  # Rate limiting between pages
-                
-            else:
-                print(f"❌ Error fetching contacts by email domains (page {page}): {data}")
-                break
-        
-        # Trim to exact limit if specified
-        if limit and len(all_contacts) > limit:
-            all_contacts = all_contacts[:limit]
-        
-        print(f"📊 Email domain filter: Found {len(all_contacts)} total contacts with domains {email_domains}")
-        
-        # Now fetch full contact data with all properties
-        if all_contacts:
-            print(f"📋 Fetching full contact properties...")
-            full_contacts = self._fetch_full_contact_properties(all_contacts)
-            return full_contacts
-        else:
-            return all_contacts
+            if not success:
+                print(f"❌ Error fetching search results (page {page}): {data}")
+                return
+            
+            page_results = data.get('results', [])
+            fetched += len(page_results)
+            yield page_results
+            
+            # Check if there are more results
+            next_page = data.get('paging', {}).get('next', {})
+            after = next_page.get('after') if next_page else None
+            
+            # Stop if no more results
+            if not after or len(page_results) == 0:
+                return
+            
+            page += 1
     
     def get_deals_by_criteria(self, criteria: Dict[str, Any]) -> List[Dict]:
         """Get deals based on various criteria ordered by creation date DESC (newest first)"""
-        headers = get_api_headers(self.prod_token)
         
         # Priority 1: Specific deal IDs
         if 'deal_ids' in criteria and criteria['deal_ids']:
@@ -236,12 +349,7 @@ class SelectiveSyncManager:
         
         # Priority 2: Date filtering
         elif 'days_since_created' in criteria:
-            from datetime import datetime, timedelta
-            
-            # Calculate the date threshold
-            days_back = criteria['days_since_created']
-            threshold_date = datetime.now() - timedelta(days=days_back)
-            threshold_timestamp = int(threshold_date.timestamp() * 1000)  # HubSpot uses milliseconds
+            threshold_timestamp = _days_ago_ms(criteria['days_since_created'])
             
             # Use search API for date filtering
             url = 'https://api.hubapi.com/crm/v3/objects/deals/search'
@@ -255,32 +363,30 @@ class SelectiveSyncManager:
                     }]
                 }],
                 'sorts': [{'propertyName': 'createdate', 'direction': 'DESCENDING'}],
-                'properties': ['dealname', 'amount', 'pipeline', 'dealstage', 'createdate', 'hs_object_id'],
-                'limit': criteria.get('limit', 50)
+                'properties': BASIC_DEAL_PROPERTIES
             }
             
-            success, data = make_hubspot_request('POST', url, headers, json_data=payload)
-            
-            if success:
-                deals = data.get('results', [])
-                print(f"📊 Date filter: Found {len(deals)} deals created in last {criteria.get('days_since_created', 'all')} days")
-                return deals
-            else:
-                print(f"❌ Error fetching deals by date: {data}")
-                return []
+            # Page through the server-side filtered results up to the requested limit
+            deals = [
+                record
+                for page_results in self._iter_search_pages(url, payload, criteria.get('limit', 50))
+                for record in page_results
+            ]
+            print(f"📊 Date filter: Found {len(deals)} deals created in last {criteria.get('days_since_created', 'all')} days")
+            return deals
         
         # Priority 3: General query with limit
         else:
             # Use simple GET API with pagination, ordered by creation date descending
             url = 'https://api.hubapi.com/crm/v3/objects/deals'
             params = {
-                'properties': 'dealname,amount,pipeline,dealstage,createdate,hs_object_id',
+                'properties': _BASIC_DEAL_PROPERTIES_PARAM,
                 'associations': 'contacts,companies',
                 'limit': criteria.get('limit', 50),
                 'sorts': 'createdate:desc'  # Order by creation date descending (newest first)
             }
             
-            success, data = make_hubspot_request('GET', url, headers, params=params)
+            success, data = self._prod_request('GET', url, params=params)
             
             if success:
                 deals = data.get('results', [])
@@ -293,264 +399,364 @@ class SelectiveSyncManager:
     def _fetch_deals_by_ids(self, deal_ids: List[str]) -> List[Dict]:
         """Fetch specific deals by their IDs"""
         deals = []
-        headers = get_api_headers(self.prod_token)
+        # Related contacts and companies are read separately through the associations API
+        fetched = {
+            str(deal['id']): deal
+            for deal in self._batch_read_objects('deals', deal_ids, BASIC_DEAL_PROPERTIES)
+        }
         
         for deal_id in deal_ids:
-            deal_url = f'https://api.hubapi.com/crm/v3/objects/deals/{deal_id}'
-            params = {
-                'properties': 'dealname,amount,pipeline,dealstage,createdate,hs_object_id',
-                'associations': 'contacts,companies'
-            }
-            
-            success, deal_data = make_hubspot_request('GET', deal_url, headers, params=params)
-            
-            if success:
-                deals.append(deal_data)
-                print(f"  ✅ Fetched deal {deal_id}")
+            if str(deal_id) in fetched:
+                deals.append(fetched[str(deal_id)])
+                logger.debug("✅ Fetched deal %s", deal_id)
             else:
-                print(f"  ❌ Failed to fetch deal {deal_id}: {deal_data}")
-            
-            time.sleep(0.1)  # Rate limiting
+                print(f"  ❌ Failed to fetch deal {deal_id}")
         
         print(f"📊 ID filter: Successfully fetched {len(deals)}/{len(deal_ids)} deals")
         return deals
     
-    def get_related_deals_for_contacts(self, contact_ids: List[str]) -> List[Dict]:
-        """Get all deals associated with specific contacts"""
-        related_deals = []
+    def _map_concurrently(self, func, items: List) -> List:
+        """Apply func to each item on the worker pool, returning results in input order"""
+        # Work fanned out from a pool worker runs inline, so the shared pool can't deadlock on itself
+        if len(items) <= 1 or getattr(self._worker_state, 'in_pool', False):
+            return [func(item) for item in items]
+        
+        # Request pacing is handled by the per-portal rate limiters
+        return list(self._get_executor().map(func, items))
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool shared by every fan-out in this manager, started on first use"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=MAX_WORKERS, thread_name_prefix='selective-sync',
+                    initializer=setattr, initargs=(self._worker_state, 'in_pool', True)
+                )
+            return self._executor
+    
+    def close(self):
+        """Shut down the shared worker pool"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _batch_read_associations(self, from_type: str, to_type: str, ids: List[str],
+                                 sandbox: bool = False) -> Dict[str, List[str]]:
+        """Read associations for many objects at once via the v4 batch associations API"""
+        url = f'https://api.hubapi.com/crm/v4/associations/{from_type}/{to_type}/batch/read'
+        request = self._sandbox_request if sandbox else self._prod_request
+        
+        # Production associations don't change during a sync, so each object is read once;
+        # sandbox associations are what this sync writes, so they are always read fresh
+        cache = {} if sandbox else self._association_cache.setdefault((from_type, to_type), {})
+        ids_to_read = list(dict.fromkeys(str(object_id) for object_id in ids if str(object_id) not in cache))
+        chunks = [ids_to_read[start:start + ASSOCIATION_READ_BATCH_SIZE]
+                  for start in range(0, len(ids_to_read), ASSOCIATION_READ_BATCH_SIZE)]
+        
+        # Chunks are independent, so read them concurrently
+        responses = self._map_concurrently(
+            lambda chunk: request('POST', url, json_data={'inputs': [{'id': object_id} for object_id in chunk]}),
+            chunks
+        )
         
-        for contact_id in contact_ids:
-            headers = get_api_headers(self.prod_token)
-            url = f'https://api.hubapi.com/crm/v3/objects/contacts/{contact_id}/associations/deals'
-            
-            success, data = make_hubspot_request('GET', url, headers)
-            
+        for chunk, (success, data) in zip(chunks, responses):
             if success:
-                deal_ids = [result['id'] for result in data.get('results', [])]
-                
-                # Get deal details
-                for deal_id in deal_ids:
-                    deal_url = f'https://api.hubapi.com/crm/v3/objects/deals/{deal_id}'
-                    deal_params = {
-                        'properties': 'dealname,amount,pipeline,dealstage,createdate',
-                        'associations': 'contacts,companies'
-                    }
-                    
-                    deal_success, deal_data = make_hubspot_request('GET', deal_url, headers, params=deal_params)
-                    
-                    if deal_success:
-                        related_deals.append(deal_data)
-                    
-                    time.sleep(0.1)  # Rate limiting
-            
-            time.sleep(0.1)  # Rate limiting
+                read = {
+                    str(result['from']['id']): [str(target['toObjectId']) for target in result.get('to', [])]
+                    for result in data.get('results', [])
+                }
+                for object_id in chunk:
+                    cache[object_id] = read.get(object_id, [])
+            else:
+                print(f"  ⚠️  Could not read {from_type} → {to_type} associations: {data}")
         
-        return related_deals
+        return {
+            str(object_id): cache[str(object_id)]
+            for object_id in ids if cache.get(str(object_id))
+        }
     
-    def get_related_contacts_for_deals(self, deal_ids: List[str]) -> List[Dict]:
-        """Get all contacts associated with specific deals"""
-        related_contacts = []
+    def _batch_read_objects(self, object_type: str, ids: List[str], properties: List[str],
+                            sandbox: bool = False) -> List[Dict]:
+        """Fetch object details for many IDs at once via the v3 batch read API"""
+        url = f'https://api.hubapi.com/crm/v3/objects/{object_type}/batch/read'
+        request = self._sandbox_request if sandbox else self._prod_request
+        objects = []
+        chunks = [ids[start:start + BATCH_SIZE] for start in range(0, len(ids), BATCH_SIZE)]
+        
+        # Chunks are independent, so read them concurrently
+        responses = self._map_concurrently(
+            lambda chunk: request('POST', url, json_data={
+                'properties': properties,
+                'inputs': [{'id': object_id} for object_id in chunk]
+            }),
+            chunks
+        )
         
-        for deal_id in deal_ids:
-            headers = get_api_headers(self.prod_token)
-            url = f'https://api.hubapi.com/crm/v3/objects/deals/{deal_id}/associations/contacts'
-            
-            success, data = make_hubspot_request('GET', url, headers)
-            
+        for chunk, (success, data) in zip(chunks, responses):
             if success:
-                contact_ids = [result['id'] for result in data.get('results', [])]
-                
-                # Get contact details
-                for contact_id in contact_ids:
-                    contact_url = f'https://api.hubapi.com/crm/v3/objects/contacts/{contact_id}'
-                    contact_params = {
-                        'properties': 'email,firstname,lastname,createdate,lifecyclestage'
-                    }
-                    
-                    contact_success, contact_data = make_hubspot_request('GET', contact_url, headers, params=contact_params)
-                    
-                    if contact_success:
-                        related_contacts.append(contact_data)
-                    
-                    time.sleep(0.1)  # Rate limiting
-            
-            time.sleep(0.1)  # Rate limiting
+                objects.extend(data.get('results', []))
+            else:
+                print(f"  ⚠️  Could not batch read {len(chunk)} {object_type}: {data}")
+        
+        return objects
+    
+    def _get_associated_objects(self, from_type: str, to_type: str, ids: List[str], properties: List[str]) -> List[Dict]:
+        """Get unique objects of to_type associated with any of the given from_type IDs"""
+        associations = self._batch_read_associations(from_type, to_type, ids)
+        
+        # Union of associated IDs, keeping first-seen order
+        target_ids = list(dict.fromkeys(
+            target_id for object_id in ids for target_id in associations.get(str(object_id), [])
+        ))
+        
+        if not target_ids:
+            return []
+        
+        # Only fetch objects not already seen earlier in this sync
+        cache = self._get_object_cache(to_type)
+        missing_ids = [target_id for target_id in target_ids if target_id not in cache]
+        
+        if missing_ids:
+            for obj in self._batch_read_objects(to_type, missing_ids, properties):
+                cache[str(obj['id'])] = obj
+        
+        return [cache[target_id] for target_id in target_ids if target_id in cache]
+    
+    @staticmethod
+    def _unique_by_id(objects: List[Dict]) -> List[Dict]:
+        """Drop repeated objects (e.g. matched by several criteria), keeping first-seen order"""
+        unique = {}
+        for obj in objects:
+            unique.setdefault(obj['id'], obj)
+        return list(unique.values())
+    
+    def _get_object_cache(self, object_type: str) -> Dict[str, Dict]:
+        """Get the per-sync cache of fetched objects for an object type"""
+        return {
+            'companies': self._company_cache,
+            'contacts': self._contact_cache,
+            'deals': self._deal_cache
+        }[object_type]
+    
+    def get_related_deals_for_contacts(self, contact_ids: List[str]) -> List[Dict]:
+        """Get all deals associated with specific contacts"""
+        if not contact_ids:
+            return []
         
-        return related_contacts
+        return self._get_associated_objects('contacts', 'deals', contact_ids, BASIC_DEAL_PROPERTIES)
+    
+    def get_related_contacts_for_deals(self, deal_ids: List[str]) -> List[Dict]:
+        """Get all contacts associated with specific deals"""
+        if not deal_ids:
+            return []
+        
+        return self._get_associated_objects(
+            'deals', 'contacts', deal_ids,
+            ['email', 'firstname', 'lastname', 'createdate', 'lifecyclestage']
+        )
     
     def get_related_companies_for_contacts(self, contact_ids: List[str]) -> List[Dict]:
         """Get all companies associated with specific contacts"""
-        related_companies = []
+        if not contact_ids:
+            return []
         
-        for contact_id in contact_ids:
-            headers = get_api_headers(self.prod_token)
-            url = f'https://api.hubapi.com/crm/v3/objects/contacts/{contact_id}/associations/companies'
+        return self._get_associated_objects(
+            'contacts', 'companies', contact_ids,
+            ['name', 'domain', 'createdate', 'city', 'state']
+        )
+    
+    def _get_safe_contact_props(self) -> List[str]:
+        """Get safe contact property names from production, fetched once per manager"""
+        if self._safe_contact_props is None:
+            url = 'https://api.hubapi.com/crm/v3/properties/contacts'
+            success, data = self._prod_request('GET', url)
             
-            success, data = make_hubspot_request('GET', url, headers)
+            if not success:
+                return []
             
-            if success:
-                company_ids = [result['id'] for result in data.get('results', [])]
-                
-                # Get company details
-                for company_id in company_ids:
-                    company_url = f'https://api.hubapi.com/crm/v3/objects/companies/{company_id}'
-                    company_params = {
-                        'properties': 'name,domain,createdate,city,state'
-                    }
-                    
-                    company_success, company_data = make_hubspot_request('GET', company_url, headers, params=company_params)
-                    
-                    if company_success:
-                        related_companies.append(company_data)
-                    
-                    time.sleep(0.1)  # Rate limiting
+            self._safe_contact_props = self._field_filter.get_safe_properties_list(data.get('results', []))
+        
+        return self._safe_contact_props
+    
+    def _get_sandbox_safe_contact_props(self) -> List[str]:
+        """Get safe contact property names from sandbox, fetched once per manager"""
+        if self._sandbox_safe_contact_props is None:
+            url = 'https://api.hubapi.com/crm/v3/properties/contacts'
+            success, data = self._sandbox_request('GET', url)
             
-            time.sleep(0.1)  # Rate limiting
+            if not success:
+                return []
+            
+            self._sandbox_safe_contact_props = self._field_filter.get_safe_properties_list(data.get('results', []))
         
-        return related_companies
+        return self._sandbox_safe_contact_props
     
     def _fetch_full_contact_properties(self, basic_contacts: List[Dict]) -> List[Dict]:
         """Fetch full contact data with all properties"""
-        from core.field_filters import HubSpotFieldFilter
-        
-        # Get all writable properties for comprehensive data fetching
-        filter_system = HubSpotFieldFilter()
-        headers = get_api_headers(self.prod_token)
+        safe_props = self._get_safe_contact_props()
         
-        # Get writable properties list
-        url = 'https://api.hubapi.com/crm/v3/properties/contacts'
-        success, data = make_hubspot_request('GET', url, headers)
-        
-        if not success:
+        if not safe_props:
             print(f"  ⚠️  Could not fetch property list, using basic contacts")
             return basic_contacts
-            
-        properties = data.get('results', [])
-        safe_props = filter_system.get_safe_properties_list(properties)
         
         print(f"  📊 Fetching {len(safe_props)} properties for {len(basic_contacts)} contacts")
         
-        # Fetch full contact data for each contact
+        # Fetch full contact data 100 contacts per request
         full_contacts = []
+        fetched = {
+            str(contact['id']): contact
+            for contact in self._batch_read_objects(
+                'contacts', [contact['id'] for contact in basic_contacts], safe_props
+            )
+        }
+        
         for contact in basic_contacts:
             contact_id = contact['id']
-            contact_url = f'https://api.hubapi.com/crm/v3/objects/contacts/{contact_id}'
-            
-            params = {
-                'properties': ','.join(safe_props)
-            }
-            
-            success, full_contact_data = make_hubspot_request('GET', contact_url, headers, params=params)
             
-            if success:
-                full_contacts.append(full_contact_data)
+            if str(contact_id) in fetched:
+                full_contacts.append(fetched[str(contact_id)])
             else:
                 print(f"  ⚠️  Could not fetch full data for contact {contact_id}, using basic data")
                 full_contacts.append(contact)
-                
-            time.sleep(0.1)  # Rate limiting
         
         print(f"  ✅ Fetched full property data for {len(full_contacts)} contacts")
         return full_contacts
     
-    def _verify_and_fix_contact_properties(self, sandbox_contact_id: str, original_contact: Dict[str, Any]) -> bool:
-        """Verify all properties were transferred correctly and fix missing ones"""
-        print(f"    🔍 Verifying properties for contact {sandbox_contact_id}...")
-        
-        from core.field_filters import HubSpotFieldFilter
+    def _verify_and_fix_contacts_bulk(self, mapping: Dict[str, Dict]) -> int:
+        """Verify migrated contacts in bulk and fix missing properties with batch updates
         
-        # Get the contact from sandbox
-        headers = get_api_headers(self.sandbox_token)
-        sandbox_url = f'https://api.hubapi.com/crm/v3/objects/contacts/{sandbox_contact_id}'
+        mapping is sandbox contact ID → original production contact.
+        Returns the number of contacts that verified cleanly or were fixed.
+        """
+        if not mapping:
+            return 0
         
-        # Get all properties for comparison
-        filter_system = HubSpotFieldFilter()
+        print(f"  🔍 Verifying properties for {len(mapping)} contacts...")
         
-        # Get writable properties list
-        props_url = 'https://api.hubapi.com/crm/v3/properties/contacts'
-        props_success, props_data = make_hubspot_request('GET', props_url, headers)
+        safe_props = self._get_sandbox_safe_contact_props()
         
-        if not props_success:
+        if not safe_props:
             print(f"    ❌ Could not fetch properties list for verification")
-            return False
+            return 0
+        
+        sandbox_props_by_id = self._read_sandbox_properties('contacts', list(mapping), safe_props)
+        safe_prop_set = set(safe_props)
+        
+        verified_count = 0
+        fixes = []
+        
+        for sandbox_id, original_contact in mapping.items():
+            sandbox_props = sandbox_props_by_id.get(str(sandbox_id))
+            
+            if sandbox_props is None:
+                print(f"    ❌ Could not fetch sandbox contact {sandbox_id} for verification")
+                continue
+            
+            missing_props, different_props = self._diff_properties(
+                original_contact.get('properties', {}), sandbox_props, safe_prop_set
+            )
+            
+            if not missing_props and not different_props:
+                verified_count += 1
+                continue
+            
+            print(f"    ⚠️  Contact {sandbox_id}: {len(missing_props)} missing, {len(different_props)} different properties")
+            
+            for prop, value in list(missing_props.items())[:5]:  # Show first 5
+                print(f"        • {prop}: {str(value)[:50]}")
+            if len(missing_props) > 5:
+                print(f"        ... and {len(missing_props)-5} more")
+            
+            for prop, values in list(different_props.items())[:3]:  # Show first 3
+                print(f"        • {prop}: '{values['original']}' vs '{values['sandbox']}'")
             
-        properties = props_data.get('results', [])
-        safe_props = filter_system.get_safe_properties_list(properties)
+            # Filter the missing properties through the field filter
+            filtered_missing = self._field_filter.filter_contact_properties(missing_props, is_update=True)
+            
+            if filtered_missing:
+                fixes.append({'id': sandbox_id, 'properties': filtered_missing})
+            else:
+                verified_count += 1
         
-        params = {
-            'properties': ','.join(safe_props)
-        }
+        if fixes:
+            print(f"    🔧 Fixing missing properties on {len(fixes)} contacts...")
+            fixed_count = self._batch_update_objects('contacts', fixes)
+            verified_count += fixed_count
+            print(f"    ✅ Updated {fixed_count}/{len(fixes)} contacts")
         
-        success, sandbox_data = make_hubspot_request('GET', sandbox_url, headers, params=params)
+        print(f"  ✅ Verified {verified_count}/{len(mapping)} contacts")
+        return verified_count
+    
+    def _read_sandbox_properties(self, object_type: str, ids: List[str], properties: List[str],
+                                 attempts: int = 3) -> Dict[str, Dict]:
+        """Batch read sandbox objects, re-reading any not found yet with a short backoff
         
-        if not success:
-            print(f"    ❌ Could not fetch sandbox contact data for verification")
-            return False
+        Returns sandbox ID → properties for every object that could be read.
+        """
+        props_by_id = {}
+        pending = [str(object_id) for object_id in ids]
+        delay = 0.05
         
-        # Compare properties
-        original_props = original_contact.get('properties', {})
-        sandbox_props = sandbox_data.get('properties', {})
+        for attempt in range(attempts):
+            for obj in self._batch_read_objects(object_type, pending, properties, sandbox=True):
+                props_by_id[str(obj['id'])] = obj.get('properties', {})
+            
+            pending = [object_id for object_id in pending if object_id not in props_by_id]
+            
+            if not pending or attempt == attempts - 1:
+                break
+            
+            time.sleep(delay)
+            delay *= 2
         
-        missing_props = {}
-        different_props = {}
+        return props_by_id
+    
+    @staticmethod
+    def _diff_properties(original_props: Dict[str, Any], sandbox_props: Dict[str, Any],
+                         allowed_props: Set[str]) -> tuple:
+        """Compare original and sandbox properties, returns (missing, different)"""
+        def normalize(value: Any) -> str:
+            if value is None:
+                return ''
+            return value.strip() if isinstance(value, str) else str(value).strip()
+        
+        # Normalize each value once; only non-blank original values are checked
+        orig_norm = {name: normalize(value) for name, value in original_props.items() if name in allowed_props}
+        orig_norm = {name: value for name, value in orig_norm.items() if value}
+        sand_norm = {name: normalize(sandbox_props.get(name)) for name in orig_norm}
+        
+        missing = {name: orig_norm[name] for name in orig_norm if not sand_norm[name]}
+        different = {
+            name: {'original': orig_norm[name], 'sandbox': sand_norm[name]}
+            for name in orig_norm.keys() - missing.keys()
+            if orig_norm[name] != sand_norm[name]
+        }
         
-        # Check important properties specifically
-        key_properties = ['phone', 'mobilephone', 'company', 'jobtitle', 'website', 'city', 'state', 'country']
+        return missing, different
+    
+    def _batch_update_objects(self, object_type: str, inputs: List[Dict]) -> int:
+        """Update sandbox objects via the v3 batch update API, returns the number updated"""
+        url = f'https://api.hubapi.com/crm/v3/objects/{object_type}/batch/update'
+        updated_count = 0
         
-        for prop_name, prop_value in original_props.items():
-            if prop_name in safe_props and prop_value:  # Only check non-empty values
-                sandbox_value = sandbox_props.get(prop_name)
-                
-                if not sandbox_value:
-                    missing_props[prop_name] = prop_value
-                elif str(sandbox_value).strip() != str(prop_value).strip():
-                    different_props[prop_name] = {
-                        'original': prop_value,
-                        'sandbox': sandbox_value
-                    }
-        
-        # Report findings
-        if missing_props or different_props:
-            print(f"    ⚠️  Property verification issues found:")
+        for start in range(0, len(inputs), BATCH_SIZE):
+            chunk = inputs[start:start + BATCH_SIZE]
             
-            if missing_props:
-                print(f"      📋 Missing properties: {len(missing_props)}")
-                for prop, value in list(missing_props.items())[:5]:  # Show first 5
-                    print(f"        • {prop}: {str(value)[:50]}")
-                if len(missing_props) > 5:
-                    print(f"        ... and {len(missing_props)-5} more")
-            
-            if different_props:
-                print(f"      🔄 Different values: {len(different_props)}")
-                for prop, values in list(different_props.items())[:3]:  # Show first 3
-                    print(f"        • {prop}: '{values['original']}' vs '{values['sandbox']}'")
-            
-            # Fix missing properties
-            if missing_props:
-                print(f"    🔧 Fixing {len(missing_props)} missing properties...")
-                
-                # Filter the missing properties through the field filter
-                filtered_missing = filter_system.filter_contact_properties(missing_props, is_update=True)
-                
-                if filtered_missing:
-                    update_payload = {'properties': filtered_missing}
-                    update_success, update_result = make_hubspot_request('PATCH', sandbox_url, headers, json_data=update_payload)
-                    
-                    if update_success:
-                        print(f"    ✅ Successfully updated {len(filtered_missing)} properties")
-                        return True
-                    else:
-                        print(f"    ❌ Failed to update properties: {update_result}")
-                        return False
-                else:
-                    print(f"    ℹ️  No properties needed updating after filtering")
-                    return True
+            success, data = self._sandbox_request('POST', url, json_data={'inputs': chunk})
+            
+            if success:
+                updated_count += len(data.get('results', []))
             else:
-                print(f"    ℹ️  Only value differences found, no missing properties to fix")
-                return True
-        else:
-            print(f"    ✅ All properties verified successfully")
-            return True
+                print(f"    ❌ Failed to batch update {len(chunk)} {object_type}: {data}")
+        
+        return updated_count
 
     def selective_sync_contacts_with_related(self, contact_criteria: Dict[str, Any]) -> Dict[str, Any]:
         """Enhanced: Sync specific contacts and their associated objects (deals, tickets, custom objects)"""
@@ -565,40 +771,57 @@ class SelectiveSyncManager:
         
         # Step 1: Get target contacts
         print("📥 Fetching target contacts...")
-        target_contacts = self.get_contacts_by_criteria(contact_criteria)
-        contact_ids = [contact['id'] for contact in target_contacts]
+        target_contacts = self._unique_by_id(self.get_contacts_by_criteria(contact_criteria))
+        contact_ids = list(dict.fromkeys(contact['id'] for contact in target_contacts))
         
         print(f"✅ Found {len(target_contacts)} target contacts")
         self.sync_metadata['primary_objects'] = contact_ids
         
-        # Step 2: Get related deals
-        print("📊 Fetching related deals...")
-        related_deals = self.get_related_deals_for_contacts(contact_ids)
-        deal_ids = [deal['id'] for deal in related_deals]
+        if not contact_ids:
+            print("⚠️  No contacts matched the criteria - nothing to sync")
+            return {
+                'contacts_synced': 0,
+                'deals_synced': 0,
+                'companies_synced': 0,
+                'associations_created': 0,
+                'sync_metadata': self.sync_metadata
+            }
         
-        print(f"✅ Found {len(related_deals)} related deals")
-        self.sync_metadata['related_objects']['deals'] = deal_ids
+        # Steps 2 and 3 only depend on the contacts, so fetch deals and companies side by side
+        # from production while the contacts are written to sandbox
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            deals_future = executor.submit(self.get_related_deals_for_contacts, contact_ids)
+            companies_future = executor.submit(self.get_related_companies_for_contacts, contact_ids)
+            
+            # Step 5 (run early): Migrate contacts, which don't depend on the related objects
+            print("\n👥 Migrating target contacts...")
+            contacts_migrated = 0
+            if target_contacts:
+                contacts_migrated = self._migrate_specific_contacts(target_contacts)
+            
+            # Step 2: Get related deals
+            print("\n📊 Fetching related deals...")
+            related_deals = deals_future.result()
+            deal_ids = list(dict.fromkeys(deal['id'] for deal in related_deals))
+            
+            print(f"✅ Found {len(related_deals)} related deals")
+            self.sync_metadata['related_objects']['deals'] = deal_ids
+            
+            # Step 3: Get related companies
+            print("🏢 Fetching related companies...")
+            related_companies = companies_future.result()
         
-        # Step 3: Get related companies
-        print("🏢 Fetching related companies...")
-        related_companies = self.get_related_companies_for_contacts(contact_ids)
-        company_ids = [company['id'] for company in related_companies]
+        company_ids = list(dict.fromkeys(company['id'] for company in related_companies))
         
         print(f"✅ Found {len(related_companies)} related companies")
         self.sync_metadata['related_objects']['companies'] = company_ids
         
-        # Step 4: Migrate companies first (so they exist for associations)
+        # Step 4: Migrate companies before deals and associations
         print("\n🏢 Migrating related companies...")
         companies_migrated = 0
         if related_companies:
             companies_migrated = self._migrate_specific_companies(related_companies)
         
-        # Step 5: Migrate contacts
-        print("\n👥 Migrating target contacts...")
-        contacts_migrated = 0
-        if target_contacts:
-            contacts_migrated = self._migrate_specific_contacts(target_contacts)
-        
         # Step 6: Migrate related deals  
         print("💼 Migrating related deals...")
         deals_migrated = 0
@@ -610,11 +833,6 @@ class SelectiveSyncManager:
         print("🔗 Creating associations...")
         associations_created = 0
         
-        # Add delay to allow HubSpot to index the newly created contacts
-        if contacts_migrated > 0 or deals_migrated > 0:
-            print("  ⏳ Waiting for HubSpot to index new records...")
-            time.sleep(3)  # 3 second delay for indexing
-        
         if contact_ids and (deal_ids or company_ids):
             associations_created = self._create_selective_associations(contact_ids, deal_ids, company_ids, deal_id_mapping)
         
@@ -641,26 +859,38 @@ class SelectiveSyncManager:
         
         # Step 1: Get target deals
         print("📥 Fetching target deals...")
-        target_deals = self.get_deals_by_criteria(deal_criteria)
-        deal_ids = [deal['id'] for deal in target_deals]
+        target_deals = self._unique_by_id(self.get_deals_by_criteria(deal_criteria))
+        deal_ids = list(dict.fromkeys(deal['id'] for deal in target_deals))
         
         print(f"✅ Found {len(target_deals)} target deals")
         self.sync_metadata['primary_objects'] = deal_ids
         
+        if not deal_ids:
+            print("⚠️  No deals matched the criteria - nothing to sync")
+            return {
+                'deals_synced': 0,
+                'contacts_synced': 0,
+                'companies_synced': 0,
+                'associations_created': 0,
+                'sync_metadata': self.sync_metadata
+            }
+        
         # Step 2: Get related contacts
         print("👥 Fetching related contacts...")
         related_contacts = self.get_related_contacts_for_deals(deal_ids)
-        contact_ids = [contact['id'] for contact in related_contacts]
+        contact_ids = list(dict.fromkeys(contact['id'] for contact in related_contacts))
         
         print(f"✅ Found {len(related_contacts)} related contacts")
         self.sync_metadata['related_objects']['contacts'] = contact_ids
         
         # Step 3: Get related companies (from contacts)
-        print("🏢 Fetching related companies...")
-        related_companies = self.get_related_companies_for_contacts(contact_ids)
-        company_ids = [company['id'] for company in related_companies]
+        related_companies = []
+        if contact_ids:
+            print("🏢 Fetching related companies...")
+            related_companies = self.get_related_companies_for_contacts(contact_ids)
+            print(f"✅ Found {len(related_companies)} related companies")
         
-        print(f"✅ Found {len(related_companies)} related companies")
+        company_ids = list(dict.fromkeys(company['id'] for company in related_companies))
         self.sync_metadata['related_objects']['companies'] = company_ids
         
         # Step 4: Migrate companies first (so they exist for associations)
@@ -686,11 +916,6 @@ class SelectiveSyncManager:
         print("🔗 Creating associations...")
         associations_created = 0
         
-        # Add delay to allow HubSpot to index the newly created records
-        if contacts_migrated > 0 or deals_migrated > 0:
-            print("  ⏳ Waiting for HubSpot to index new records...")
-            time.sleep(3)  # 3 second delay for indexing
-        
         if deal_ids and (contact_ids or company_ids):
             associations_created = self._create_selective_associations(contact_ids, deal_ids, company_ids, deal_id_mapping)
         
@@ -729,11 +954,20 @@ class SelectiveSyncManager:
         os.makedirs('reports', exist_ok=True)
         report_file = f'reports/selective_sync_{timestamp}.json'
         
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(report_file, 'wb') as f:
+            f.write(json_dumps(report, indent=True))
+        
+        # The sync is complete, so a later sync on this manager reads production afresh
+        self._clear_production_caches()
         
         return report_file
     
+    def _clear_production_caches(self):
+        """Forget the production objects and associations read during the last sync"""
+        for object_type in ('companies', 'contacts', 'deals'):
+            self._get_object_cache(object_type).clear()
+        self._association_cache.clear()
+    
     def selective_sync_tickets_with_related(self, ticket_criteria: Dict[str, Any]) -> Dict[str, Any]:
         """Sync specific tickets and their associated objects"""
         print("🎯 SELECTIVE SYNC: TICKETS → ALL RELATED OBJECTS")
@@ -743,26 +977,38 @@ class SelectiveSyncManager:
         
         # Step 1: Get target tickets based on criteria
         print("📥 Fetching target tickets...")
-        target_tickets = self.get_tickets_by_criteria(ticket_criteria)
-        ticket_ids = [ticket['id'] for ticket in target_tickets]
+        target_tickets = self._unique_by_id(self.get_tickets_by_criteria(ticket_criteria))
+        ticket_ids = list(dict.fromkeys(ticket['id'] for ticket in target_tickets))
         
         print(f"✅ Found {len(target_tickets)} target tickets")
         self.sync_metadata['primary_objects'] = ticket_ids
         
+        if not ticket_ids:
+            print("⚠️  No tickets matched the criteria - nothing to sync")
+            return {
+                'tickets_synced': 0,
+                'contacts_synced': 0,
+                'companies_synced': 0,
+                'associations_created': 0,
+                'sync_metadata': self.sync_metadata
+            }
+        
         # Step 2: Get related objects (contacts, companies, deals if any)
         print("👥 Fetching related contacts...")
         related_contacts = self.get_related_contacts_for_tickets(ticket_ids)
-        contact_ids = [contact['id'] for contact in related_contacts]
+        contact_ids = list(dict.fromkeys(contact['id'] for contact in related_contacts))
         
         print(f"✅ Found {len(related_contacts)} related contacts")
         self.sync_metadata['related_objects']['contacts'] = contact_ids
         
         # Step 3: Get related companies
-        print("🏢 Fetching related companies...")
-        related_companies = self.get_related_companies_for_contacts(contact_ids)
-        company_ids = [company['id'] for company in related_companies]
+        related_companies = []
+        if contact_ids:
+            print("🏢 Fetching related companies...")
+            related_companies = self.get_related_companies_for_contacts(contact_ids)
+            print(f"✅ Found {len(related_companies)} related companies")
         
-        print(f"✅ Found {len(related_companies)} related companies")
+        company_ids = list(dict.fromkeys(company['id'] for company in related_companies))
         self.sync_metadata['related_objects']['companies'] = company_ids
         
         # Step 4: Migrate in dependency order
@@ -785,7 +1031,6 @@ class SelectiveSyncManager:
         print("🔗 Creating associations...")
         associations_created = 0
         if ticket_ids and (contact_ids or company_ids):
-            time.sleep(3)  # Wait for indexing
             associations_created = self._create_ticket_associations(ticket_ids, contact_ids, company_ids)
         
         results = {
@@ -808,8 +1053,8 @@ class SelectiveSyncManager:
         
         # Step 1: Get target custom objects
         print(f"📥 Fetching target {object_type}...")
-        target_objects = self.get_custom_objects_by_criteria(custom_criteria)
-        object_ids = [obj['id'] for obj in target_objects]
+        target_objects = self._unique_by_id(self.get_custom_objects_by_criteria(custom_criteria))
+        object_ids = list(dict.fromkeys(obj['id'] for obj in target_objects))
         
         print(f"✅ Found {len(target_objects)} target {object_type}")
         self.sync_metadata['primary_objects'] = object_ids
@@ -820,9 +1065,9 @@ class SelectiveSyncManager:
         related_companies = self.get_related_companies_for_custom_objects(object_ids, object_type)
         related_deals = self.get_related_deals_for_custom_objects(object_ids, object_type)
         
-        contact_ids = [contact['id'] for contact in related_contacts]
-        company_ids = [company['id'] for company in related_companies] 
-        deal_ids = [deal['id'] for deal in related_deals]
+        contact_ids = list(dict.fromkeys(contact['id'] for contact in related_contacts))
+        company_ids = list(dict.fromkeys(company['id'] for company in related_companies))
+        deal_ids = list(dict.fromkeys(deal['id'] for deal in related_deals))
         
         print(f"✅ Found {len(related_contacts)} contacts, {len(related_companies)} companies, {len(related_deals)} deals")
         self.sync_metadata['related_objects'] = {
@@ -857,7 +1102,6 @@ class SelectiveSyncManager:
         print("🔗 Creating associations...")
         associations_created = 0
         if object_ids and (contact_ids or company_ids or deal_ids):
-            time.sleep(3)  # Wait for indexing
             associations_created = self._create_custom_object_associations(
                 object_ids, contact_ids, company_ids, deal_ids, object_type, deal_id_mapping
             )
@@ -875,7 +1119,6 @@ class SelectiveSyncManager:
     
     def get_tickets_by_criteria(self, criteria: Dict[str, Any]) -> List[Dict]:
         """Get tickets based on various criteria"""
-        headers = get_api_headers(self.prod_token)
         
         # Priority 1: Specific ticket IDs
         if 'ticket_ids' in criteria and criteria['ticket_ids']:
@@ -884,12 +1127,7 @@ class SelectiveSyncManager:
         
         # Priority 2: Date filtering
         elif 'days_since_created' in criteria:
-            from datetime import datetime, timedelta
-            
-            # Calculate the date threshold
-            days_back = criteria['days_since_created']
-            threshold_date = datetime.now() - timedelta(days=days_back)
-            threshold_timestamp = int(threshold_date.timestamp() * 1000)  # HubSpot uses milliseconds
+            threshold_timestamp = _days_ago_ms(criteria['days_since_created'])
             
             # Use search API for date filtering
             url = 'https://api.hubapi.com/crm/v3/objects/tickets/search'
@@ -903,11 +1141,11 @@ class SelectiveSyncManager:
                     }]
                 }],
                 'sorts': [{'propertyName': 'createdate', 'direction': 'DESCENDING'}],
-                'properties': ['subject', 'hs_ticket_priority', 'hs_pipeline_stage', 'createdate', 'hs_object_id'],
+                'properties': ['subject', 'hs_ticket_priority', 'hs_pipeline_stage', 'createdate'],
                 'limit': criteria.get('limit', 50)
             }
             
-            success, data = make_hubspot_request('POST', url, headers, json_data=payload)
+            success, data = self._prod_request('POST', url, json_data=payload)
             
             if success:
                 tickets = data.get('results', [])
@@ -922,12 +1160,12 @@ class SelectiveSyncManager:
             # Use simple GET API with pagination, ordered by creation date descending
             url = 'https://api.hubapi.com/crm/v3/objects/tickets'
             params = {
-                'properties': 'subject,hs_ticket_priority,hs_pipeline_stage,createdate,hs_object_id',
+                'properties': 'subject,hs_ticket_priority,hs_pipeline_stage,createdate',
                 'limit': criteria.get('limit', 50),
                 'sorts': 'createdate:desc'  # Order by creation date descending (newest first)
             }
             
-            success, data = make_hubspot_request('GET', url, headers, params=params)
+            success, data = self._prod_request('GET', url, params=params)
             
             if success:
                 tickets = data.get('results', [])
@@ -940,7 +1178,6 @@ class SelectiveSyncManager:
     def get_custom_objects_by_criteria(self, criteria: Dict[str, Any]) -> List[Dict]:
         """Get custom objects based on various criteria"""
         object_type = criteria.get('custom_object_type', 'custom_objects')
-        headers = get_api_headers(self.prod_token)
         
         # Priority 1: Specific object IDs
         if 'custom_object_ids' in criteria and criteria['custom_object_ids']:
@@ -949,12 +1186,7 @@ class SelectiveSyncManager:
         
         # Priority 2: Date filtering
         elif 'days_since_created' in criteria:
-            from datetime import datetime, timedelta
-            
-            # Calculate the date threshold
-            days_back = criteria['days_since_created']
-            threshold_date = datetime.now() - timedelta(days=days_back)
-            threshold_timestamp = int(threshold_date.timestamp() * 1000)  # HubSpot uses milliseconds
+            threshold_timestamp = _days_ago_ms(criteria['days_since_created'])
             
             # Use search API for date filtering
             url = f'https://api.hubapi.com/crm/v3/objects/{object_type}/search'
@@ -971,7 +1203,7 @@ class SelectiveSyncManager:
                 'limit': criteria.get('limit', 50)
             }
             
-            success, data = make_hubspot_request('POST', url, headers, json_data=payload)
+            success, data = self._prod_request('POST', url, json_data=payload)
             
             if success:
                 objects = data.get('results', [])
@@ -990,7 +1222,7 @@ class SelectiveSyncManager:
                 'sorts': 'createdate:desc'  # Order by creation date descending (newest first)
             }
             
-            success, data = make_hubspot_request('GET', url, headers, params=params)
+            success, data = self._prod_request('GET', url, params=params)
             
             if success:
                 objects = data.get('results', [])
@@ -1003,23 +1235,19 @@ class SelectiveSyncManager:
     def _fetch_tickets_by_ids(self, ticket_ids: List[str]) -> List[Dict]:
         """Fetch specific tickets by their IDs"""
         tickets = []
-        headers = get_api_headers(self.prod_token)
+        fetched = {
+            str(ticket['id']): ticket
+            for ticket in self._batch_read_objects(
+                'tickets', ticket_ids, ['subject', 'hs_ticket_priority', 'hs_pipeline_stage', 'createdate']
+            )
+        }
         
         for ticket_id in ticket_ids:
-            ticket_url = f'https://api.hubapi.com/crm/v3/objects/tickets/{ticket_id}'
-            params = {
-                'properties': 'subject,hs_ticket_priority,hs_pipeline_stage,createdate,hs_object_id'
-            }
-            
-            success, ticket_data = make_hubspot_request('GET', ticket_url, headers, params=params)
-            
-            if success:
-                tickets.append(ticket_data)
-                print(f"  ✅ Fetched ticket {ticket_id}")
+            if str(ticket_id) in fetched:
+                tickets.append(fetched[str(ticket_id)])
+                logger.debug("✅ Fetched ticket %s", ticket_id)
             else:
-                print(f"  ❌ Failed to fetch ticket {ticket_id}: {ticket_data}")
-            
-            time.sleep(0.1)  # Rate limiting
+                print(f"  ❌ Failed to fetch ticket {ticket_id}")
         
         print(f"📊 ID filter: Successfully fetched {len(tickets)}/{len(ticket_ids)} tickets")
         return tickets
@@ -1027,26 +1255,27 @@ class SelectiveSyncManager:
     def _fetch_custom_objects_by_ids(self, object_ids: List[str], object_type: str) -> List[Dict]:
         """Fetch specific custom objects by their IDs"""
         objects = []
-        headers = get_api_headers(self.prod_token)
+        # No explicit properties, so each object comes back with its default properties as before
+        fetched = {
+            str(obj['id']): obj
+            for obj in self._batch_read_objects(object_type, object_ids, [])
+        }
         
         for object_id in object_ids:
-            object_url = f'https://api.hubapi.com/crm/v3/objects/{object_type}/{object_id}'
-            
-            success, object_data = make_hubspot_request('GET', object_url, headers)
-            
-            if success:
-                objects.append(object_data)
-                print(f"  ✅ Fetched {object_type} {object_id}")
+            if str(object_id) in fetched:
+                objects.append(fetched[str(object_id)])
+                logger.debug("✅ Fetched %s %s", object_type, object_id)
             else:
-                print(f"  ❌ Failed to fetch {object_type} {object_id}: {object_data}")
-            
-            time.sleep(0.1)  # Rate limiting
+                print(f"  ❌ Failed to fetch {object_type} {object_id}")
         
         print(f"📊 ID filter: Successfully fetched {len(objects)}/{len(object_ids)} {object_type}")
         return objects
     
     def get_related_contacts_for_tickets(self, ticket_ids: List[str]) -> List[Dict]:
         """Get all contacts associated with specific tickets"""
+        if not ticket_ids:
+            return []
+        
         # Implementation placeholder - in real scenario would fetch ticket-contact associations
         print(f"  📞 Getting contacts for {len(ticket_ids)} tickets...")
         # For now, return empty list as ticket-contact associations need specific implementation
@@ -1054,18 +1283,27 @@ class SelectiveSyncManager:
     
     def get_related_contacts_for_custom_objects(self, object_ids: List[str], object_type: str) -> List[Dict]:
         """Get all contacts associated with specific custom objects"""
+        if not object_ids:
+            return []
+        
         # Implementation placeholder - associations vary by object type
         print(f"  📞 Getting contacts for {len(object_ids)} {object_type}...")
         return []
     
     def get_related_companies_for_custom_objects(self, object_ids: List[str], object_type: str) -> List[Dict]:
         """Get all companies associated with specific custom objects"""
+        if not object_ids:
+            return []
+        
         # Implementation placeholder - associations vary by object type  
         print(f"  🏢 Getting companies for {len(object_ids)} {object_type}...")
         return []
     
     def get_related_deals_for_custom_objects(self, object_ids: List[str], object_type: str) -> List[Dict]:
         """Get all deals associated with specific custom objects"""
+        if not object_ids:
+            return []
+        
         # Implementation placeholder - associations vary by object type
         print(f"  💼 Getting deals for {len(object_ids)} {object_type}...")
         return []
@@ -1104,228 +1342,601 @@ class SelectiveSyncManager:
         """Migrate specific contacts to sandbox"""
         print(f"  📞 Migrating {len(contacts)} contacts...")
         
-        # Import contact migration functions
-        sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'migrations'))
-        from contact_migration import (
-            get_writable_properties, find_contact_by_email, 
-            create_contact_in_sandbox, update_contact_in_sandbox,
-            get_contact_display_name, print_progress_bar
-        )
-        from core.field_filters import HubSpotFieldFilter
-        
         migrated_count = 0
         
         try:
-            # Initialize field filtering
-            filter_system = HubSpotFieldFilter()
-            
-            # Get writable properties
-            writable_props = get_writable_properties(self.sandbox_token, filter_system)
+            # Get writable properties (fetched once per sync, then cached)
+            writable_props = self._get_sandbox_safe_contact_props()
             print(f"    📊 Using {len(writable_props)} safe properties")
             
-            # Migrate each specific contact
-            for i, contact in enumerate(contacts, 1):
-                email = contact.get('properties', {}).get('email')
-                display_name = get_contact_display_name(contact)
-                
-                print_progress_bar(i-1, len(contacts), "Migrating contacts")
-                
-                if email:
-                    # Contact with email - check for duplicates
-                    print(f"    📧 {display_name} ({email})")
-                    
-                    # Check if contact exists in sandbox
-                    existing_id = find_contact_by_email(self.sandbox_token, email)
-                    
-                    if existing_id:
-                        # Update existing contact
-                        success, _ = update_contact_in_sandbox(self.sandbox_token, existing_id, contact, filter_system)
-                        if success:
-                            print(f"      🔄 Updated existing contact (ID: {existing_id})")
-                            migrated_count += 1
-                            
-                            # Verify and fix properties
-                            time.sleep(0.5)  # Brief delay before verification
-                            try:
-                                self._verify_and_fix_contact_properties(existing_id, contact)
-                            except Exception as e:
-                                print(f"      ⚠️  Property verification failed: {str(e)}")
-                    else:
-                        # Create new contact
-                        success, new_id = create_contact_in_sandbox(self.sandbox_token, contact, filter_system)
-                        if success:
-                            print(f"      ✅ Created new contact (ID: {new_id})")
-                            migrated_count += 1
-                            
-                            # Verify and fix properties
-                            time.sleep(0.5)  # Brief delay before verification
-                            try:
-                                self._verify_and_fix_contact_properties(new_id, contact)
-                            except Exception as e:
-                                print(f"      ⚠️  Property verification failed: {str(e)}")
-                        else:
-                            print(f"      ❌ Failed to create contact: {new_id}")
-                else:
-                    # Contact without email - create directly (no duplicate checking possible)
-                    print(f"    👤 {display_name} (no email)")
-                    
-                    # Create new contact without duplicate checking
-                    success, new_id = create_contact_in_sandbox(self.sandbox_token, contact, filter_system)
-                    if success:
-                        print(f"      ✅ Created new contact (ID: {new_id})")
-                        migrated_count += 1
-                        
-                        # Verify and fix properties
-                        time.sleep(0.5)  # Brief delay before verification
-                        try:
-                            self._verify_and_fix_contact_properties(new_id, contact)
-                        except Exception as e:
-                            print(f"      ⚠️  Property verification failed: {str(e)}")
-                    else:
-                        print(f"      ❌ Failed to create contact: {new_id}")
-            
-            print_progress_bar(len(contacts), len(contacts), "Migrating contacts")
+            contact_id_mapping = self._batch_migrate_contacts(contacts, self._field_filter)
+            migrated_count = len(contact_id_mapping)
+            self._contact_id_mapping.update(contact_id_mapping)
+            
             print(f"  ✅ Successfully migrated {migrated_count}/{len(contacts)} contacts")
             
+            # Verify and fix properties for all migrated contacts at once
+            contacts_by_id = {contact['id']: contact for contact in contacts}
+            verification_mapping = {
+                sandbox_id: contacts_by_id[prod_id] for prod_id, sandbox_id in contact_id_mapping.items()
+            }
+            
+            if verification_mapping:
+                try:
+                    self._verify_and_fix_contacts_bulk(verification_mapping)
+                except Exception as e:
+                    print(f"  ⚠️  Property verification failed: {str(e)}")
+            
         except Exception as e:
             print(f"  ❌ Contact migration failed: {str(e)}")
             
         return migrated_count
     
+    def _batch_migrate_contacts(self, contacts: List[Dict], filter_system: HubSpotFieldFilter) -> Dict[str, str]:
+        """Create or update contacts in sandbox using the batch APIs
+        
+        Contacts are matched to existing sandbox records by email, 100 at a time.
+        Contacts without an email, or that a batch call could not write, go through
+        the single-record create/update path instead.
+        
+        Returns mapping of production contact ID → sandbox contact ID.
+        """
+        contact_id_mapping = {}
+        email_contacts = {}  # lowercased email → first contact with that email
+        duplicate_contacts = []
+        no_email_contacts = []
+        
+        for contact in contacts:
+            email = (contact.get('properties', {}).get('email') or '').strip().lower()
+            
+            if not email:
+                no_email_contacts.append(contact)
+            elif email in email_contacts:
+                duplicate_contacts.append(contact)
+            else:
+                email_contacts[email] = contact
+        
+        emails = list(email_contacts)
+        batch_count = (len(emails) + BATCH_SIZE - 1) // BATCH_SIZE
+        
+        for start in range(0, len(emails), BATCH_SIZE):
+            chunk = {email: email_contacts[email] for email in emails[start:start + BATCH_SIZE]}
+            
+            existing_ids = self._batch_find_contacts_by_email(list(chunk))
+            
+            to_create = [email for email in chunk if email not in existing_ids]
+            to_update = [email for email in chunk if email in existing_ids]
+            
+            created_ids = self._batch_create_contacts([chunk[email] for email in to_create], filter_system)
+            
+            for email in to_create:
+                contact = chunk[email]
+                new_id = created_ids.get(email)
+                
+                if new_id is None:
+                    # Not written by the batch call - retry on its own to surface the error
+                    success, new_id = create_contact_in_sandbox(
+                        self.sandbox_token, contact, filter_system,
+                        session=self._sandbox_session, rate_limiter=self._sandbox_limiter
+                    )
+                    if not success:
+                        print(f"      ❌ Failed to create contact {get_contact_display_name(contact)}: {new_id}")
+                        continue
+                
+                contact_id_mapping[contact['id']] = new_id
+                self._created_sandbox_ids['contacts'].append(new_id)
+            
+            updated_ids = self._batch_update_contacts(
+                {existing_ids[email]: chunk[email] for email in to_update}, filter_system
+            )
+            
+            for email in to_update:
+                contact = chunk[email]
+                sandbox_id = existing_ids[email]
+                
+                if sandbox_id not in updated_ids:
+                    success, result = update_contact_in_sandbox(
+                        self.sandbox_token, sandbox_id, contact, filter_system,
+                        session=self._sandbox_session, rate_limiter=self._sandbox_limiter
+                    )
+                    if not success:
+                        print(f"      ❌ Failed to update contact {get_contact_display_name(contact)}: {result}")
+                        continue
+                
+                contact_id_mapping[contact['id']] = sandbox_id
+            
+            print(f"    📦 Batch {start // BATCH_SIZE + 1}/{batch_count}: {len(to_create)} new, {len(to_update)} existing contacts")
+        
+        # Contact without email - create directly (no duplicate checking possible)
+        for contact in no_email_contacts:
+            print(f"    👤 {get_contact_display_name(contact)} (no email)")
+            
+            success, new_id = create_contact_in_sandbox(
+                self.sandbox_token, contact, filter_system,
+                session=self._sandbox_session, rate_limiter=self._sandbox_limiter
+            )
+            if success:
+                print(f"      ✅ Created new contact (ID: {new_id})")
+                contact_id_mapping[contact['id']] = new_id
+                self._created_sandbox_ids['contacts'].append(new_id)
+            else:
+                print(f"      ❌ Failed to create contact: {new_id}")
+        
+        # Same email seen earlier in this batch - reuse that sandbox contact
+        for contact in duplicate_contacts:
+            email = contact['properties']['email'].strip().lower()
+            sandbox_id = contact_id_mapping.get(email_contacts[email]['id'])
+            
+            if sandbox_id:
+                print(f"    🔄 {email} already processed in this batch (ID: {sandbox_id})")
+                contact_id_mapping[contact['id']] = sandbox_id
+        
+        return contact_id_mapping
+    
+    def _batch_find_contacts_by_email(self, emails: List[str]) -> Dict[str, str]:
+        """Look up sandbox contacts by email (up to 100), returns lowercased email → contact ID"""
+        url = 'https://api.hubapi.com/crm/v3/objects/contacts/batch/read'
+        payload = {
+            'idProperty': 'email',
+            'properties': ['email'],
+            'inputs': [{'id': email} for email in emails]
+        }
+        
+        success, data = self._sandbox_request('POST', url, json_data=payload)
+        
+        if not success:
+            print(f"    ⚠️  Could not look up existing contacts by email: {data}")
+            return {}
+        
+        return {
+            (result.get('properties', {}).get('email') or '').lower(): str(result['id'])
+            for result in data.get('results', [])
+        }
+    
+    def _batch_create_contacts(self, contacts: List[Dict], filter_system: HubSpotFieldFilter) -> Dict[str, str]:
+        """Create sandbox contacts (up to 100) in one call, returns lowercased email → new contact ID"""
+        if not contacts:
+            return {}
+        
+        url = 'https://api.hubapi.com/crm/v3/objects/contacts/batch/create'
+        payload = {
+            'inputs': [
+                {'properties': filter_system.filter_contact_properties(contact.get('properties', {}), is_update=False)}
+                for contact in contacts
+            ]
+        }
+        
+        success, data = self._sandbox_request('POST', url, json_data=payload)
+        
+        if not success:
+            print(f"    ⚠️  Batch create failed, retrying contacts individually: {data}")
+            return {}
+        
+        # Results are not guaranteed to come back in input order
+        return {
+            (result.get('properties', {}).get('email') or '').lower(): str(result['id'])
+            for result in data.get('results', [])
+        }
+    
+    def _batch_update_contacts(self, contacts_by_sandbox_id: Dict[str, Dict], filter_system: HubSpotFieldFilter) -> Set[str]:
+        """Update existing sandbox contacts (up to 100) in one call, returns the IDs written"""
+        inputs = []
+        unchanged_ids = set()
+        
+        for sandbox_id, contact in contacts_by_sandbox_id.items():
+            properties = filter_system.filter_contact_properties(contact.get('properties', {}), is_update=True)
+            
+            if properties:
+                inputs.append({'id': sandbox_id, 'properties': properties})
+            else:
+                unchanged_ids.add(sandbox_id)  # No properties to update
+        
+        if not inputs:
+            return unchanged_ids
+        
+        url = 'https://api.hubapi.com/crm/v3/objects/contacts/batch/update'
+        success, data = self._sandbox_request('POST', url, json_data={'inputs': inputs})
+        
+        if not success:
+            print(f"    ⚠️  Batch update failed, retrying contacts individually: {data}")
+            return unchanged_ids
+        
+        return unchanged_ids | {str(result['id']) for result in data.get('results', [])}
+    
     def _migrate_specific_companies(self, companies: List[Dict]) -> int:
         """Migrate specific companies to sandbox"""
         print(f"  🏢 Migrating {len(companies)} companies...")
         
         migrated_count = 0
-        headers = get_api_headers(self.sandbox_token)
         
         # Enhanced in-memory cache to track companies processed in this batch
-        processed_companies = {}  # normalized_key -> company_id
+        processed_companies = {}  # normalized_key -> index of the first company with that key
+        verification_mapping = {}  # sandbox company ID → original company
         
         try:
-            for i, company in enumerate(companies, 1):
+            self._company_index = self._build_company_index(len(companies))
+            self._company_search_cache = {}
+            
+            # Group duplicates up front so each real company is looked up only once,
+            # even though the lookups below run concurrently
+            leaders = []
+            duplicates = {}  # company index → (leader index, matching cache key)
+            
+            for i, company in enumerate(companies):
                 company_props = company.get('properties', {})
-                domain = (company_props.get('domain') or '').strip()
-                name = (company_props.get('name') or '').strip()
-                phone = (company_props.get('phone') or '').strip()
+                cache_keys = self._generate_company_cache_keys(
+                    (company_props.get('name') or '').strip(),
+                    (company_props.get('domain') or '').strip(),
+                    (company_props.get('phone') or '').strip()
+                )
                 
-                print(f"    🏢 [{i}/{len(companies)}] {name or 'Unnamed Company'} ({domain or 'no domain'})")
+                matched_key = next((key for key in cache_keys if key in processed_companies), None)
                 
-                # Create multiple cache keys for better duplicate detection
-                cache_keys = self._generate_company_cache_keys(name, domain, phone)
-                existing_batch_id = None
+                if matched_key:
+                    duplicates[i] = (processed_companies[matched_key], matched_key)
+                else:
+                    leaders.append(i)
+                    for cache_key in cache_keys:
+                        processed_companies[cache_key] = i
+            
+            leader_results, confirmed_ids = self._write_companies({i: companies[i] for i in leaders})
+            
+            # Collected and written in one go rather than two flushed prints per company
+            report_lines = []
+            
+            for i, company in enumerate(companies):
+                company_props = company.get('properties', {})
+                domain = (company_props.get('domain') or '').strip()
+                name = (company_props.get('name') or '').strip()
                 
-                # Check if we already processed this company in this batch using any cache key
-                for cache_key in cache_keys:
-                    if cache_key in processed_companies:
-                        existing_batch_id = processed_companies[cache_key]
-                        print(f"      🔄 Already processed in this batch (ID: {existing_batch_id}, key: {cache_key[:50]})")
-                        break
+                report_lines.append(f"    🏢 [{i + 1}/{len(companies)}] {name or 'Unnamed Company'} ({domain or 'no domain'})")
                 
-                if existing_batch_id:
-                    migrated_count += 1
+                if i in duplicates:
+                    leader_index, cache_key = duplicates[i]
+                    existing_batch_id = leader_results[leader_index][0]
+                    
+                    if existing_batch_id:
+                        self._company_id_mapping[company['id']] = existing_batch_id
+                        report_lines.append(f"      🔄 Already processed in this batch (ID: {existing_batch_id}, key: {cache_key[:50]})")
+                        migrated_count += 1
                     continue
                 
-                # Enhanced duplicate detection - check multiple criteria
-                print(f"      🔍 Searching for existing company: '{name}' (domain: '{domain}')")
-                existing_company_id = self._find_existing_company(domain, name, company_props)
+                sandbox_id, message = leader_results[i]
+                report_lines.append(f"      {message}")
                 
-                if existing_company_id:
-                    print(f"      🔄 Company already exists (ID: {existing_company_id})")
-                    # Update existing company with all properties
-                    success = self._update_company_properties(existing_company_id, company)
-                    if success:
-                        print(f"      ✅ Updated company properties")
-                    
-                    # Also verify properties for existing companies
-                    time.sleep(0.5)
-                    self._verify_and_fix_company_properties(existing_company_id, company)
+                if sandbox_id:
+                    self._company_id_mapping[company['id']] = sandbox_id
                     
-                    # Cache this result for all possible keys
-                    for cache_key in cache_keys:
-                        processed_companies[cache_key] = existing_company_id
+                    # Verify and fix properties like we do for contacts, unless the
+                    # sandbox values are already known to match
+                    if sandbox_id not in confirmed_ids:
+                        verification_mapping[sandbox_id] = company
                     migrated_count += 1
-                else:
-                    print(f"      ➕ No existing company found, creating new one")
-                    # Create new company with all properties
-                    success, new_company_id = self._create_company_in_sandbox(company)
-                    if success:
-                        print(f"      ✅ Created new company (ID: {new_company_id})")
-                        migrated_count += 1
-                        
-                        # Cache the new company ID for all possible keys
-                        for cache_key in cache_keys:
-                            processed_companies[cache_key] = new_company_id
-                        
-                        # Verify and fix properties like we do for contacts
-                        time.sleep(0.5)  # Brief delay before verification
-                        self._verify_and_fix_company_properties(new_company_id, company)
-                    else:
-                        print(f"      ❌ Failed to create company: {new_company_id}")
-                
-                time.sleep(0.2)  # Rate limiting
+            
+            if report_lines:
+                print('\n'.join(report_lines))
             
             print(f"  ✅ Successfully migrated {migrated_count}/{len(companies)} companies")
             print(f"  📋 Batch cache entries: {len(processed_companies)}")
             
-        except Exception as e:
-            print(f"  ❌ Company migration failed: {str(e)}")
+            # Verify and fix properties for all migrated companies at once
+            if verification_mapping:
+                self._verify_and_fix_companies_bulk(verification_mapping)
+            
+        except Exception as e:
+            print(f"  ❌ Company migration failed: {str(e)}")
+            
+        return migrated_count
+    
+    def _write_companies(self, companies: Dict[int, Dict]) -> tuple[Dict[int, tuple], Set[str]]:
+        """
+        Update or create companies in sandbox
+        
+        Returns index → (sandbox ID or None, status message), and the IDs of companies
+        already known to hold the migrated values - left untouched because they matched,
+        or confirmed by the properties echoed back from the write - which need no verification
+        """
+        indexes = list(companies)
+        
+        # Enhanced duplicate detection - check multiple criteria
+        existing_ids = dict(zip(indexes, self._map_concurrently(self._find_existing_company_for, list(companies.values()))))
+        
+        results = {}
+        to_create = {}
+        unchanged_ids = set()
+        
+        for i in indexes:
+            existing_company_id = existing_ids[i]
+            
+            if existing_company_id:
+                # Update existing company with all properties
+                if not self._queue_company_update(existing_company_id, companies[i]):
+                    unchanged_ids.add(existing_company_id)
+            elif self._get_safe_company_properties(companies[i].get('properties', {})):
+                to_create[i] = companies[i]
+            else:
+                results[i] = (None, "❌ Failed to create company: No safe properties to migrate")
+        
+        updated_ids, confirmed_ids = self._flush_company_updates()
+        
+        for i in indexes:
+            existing_company_id = existing_ids[i]
+            if existing_company_id:
+                if existing_company_id in unchanged_ids:
+                    status = "no property changes"
+                elif existing_company_id in updated_ids:
+                    status = "properties updated"
+                else:
+                    status = "property update failed"
+                results[i] = (existing_company_id, f"🔄 Company already exists (ID: {existing_company_id}), {status}")
+        
+        # Create new companies with all properties
+        created_ids, confirmed_created_ids = self._batch_create_companies(to_create)
+        confirmed_ids |= confirmed_created_ids
+        
+        for i, company in to_create.items():
+            new_company_id = created_ids.get(i)
+            
+            if new_company_id is None:
+                # Not written by the batch call - retry on its own to surface the error
+                success, new_company_id = self._create_company_in_sandbox(company)
+                if not success:
+                    results[i] = (None, f"❌ Failed to create company: {new_company_id}")
+                    continue
+            
+            self._created_sandbox_ids['companies'].append(new_company_id)
+            self._cache_created_company(new_company_id, company.get('properties', {}))
+            results[i] = (new_company_id, f"✅ Created new company (ID: {new_company_id})")
+        
+        return results, unchanged_ids | confirmed_ids
+    
+    def _find_existing_company_for(self, company: Dict) -> Optional[str]:
+        """Find the sandbox ID of an existing company matching a production company"""
+        company_props = company.get('properties', {})
+        domain = (company_props.get('domain') or '').strip()
+        name = (company_props.get('name') or '').strip()
+        
+        return self._find_existing_company(domain, name, company_props)
+    
+    def _company_match_key(self, company_props: Dict[str, Any]) -> str:
+        """Key used to match batch create results back to their input companies"""
+        return '|'.join([
+            (company_props.get('name') or '').strip().lower(),
+            self._normalize_domain((company_props.get('domain') or '').strip()),
+            self._normalize_phone((company_props.get('phone') or '').strip())
+        ])
+    
+    def _batch_create_companies(self, companies: Dict[int, Dict]) -> tuple[Dict[int, str], Set[str]]:
+        """
+        Create sandbox companies via the v3 batch create API
+        
+        Returns index → new company ID, and the new IDs whose echoed properties match what was sent
+        """
+        url = 'https://api.hubapi.com/crm/v3/objects/companies/batch/create'
+        indexes = list(companies)
+        created_ids = {}
+        confirmed_ids = set()
+        
+        for start in range(0, len(indexes), BATCH_SIZE):
+            chunk = indexes[start:start + BATCH_SIZE]
+            
+            # Results are not guaranteed to come back in input order, so match them by key
+            pending_by_key = {}
+            for i in chunk:
+                pending_by_key.setdefault(self._company_match_key(companies[i].get('properties', {})), []).append(i)
+            
+            sent_props = {i: self._get_safe_company_properties(companies[i].get('properties', {})) for i in chunk}
+            payload = {'inputs': [{'properties': sent_props[i]} for i in chunk]}
+            
+            success, data = self._sandbox_request('POST', url, json_data=payload)
+            
+            if not success:
+                print(f"    ⚠️  Batch create failed, retrying companies individually: {data}")
+                continue
+            
+            for result in data.get('results', []):
+                echoed_props = result.get('properties', {})
+                pending = pending_by_key.get(self._company_match_key(echoed_props))
+                if pending:
+                    i = pending.pop(0)
+                    created_ids[i] = str(result['id'])
+                    if self._echo_confirms(sent_props[i], echoed_props):
+                        confirmed_ids.add(created_ids[i])
+        
+        return created_ids, confirmed_ids
+    
+    def _queue_company_update(self, company_id: str, original_company: Dict[str, Any]) -> bool:
+        """Queue changed properties of an existing sandbox company for a batched update, False if nothing changed"""
+        # Get comprehensive company properties like we do for contacts
+        safe_props = self._get_safe_company_properties(original_company.get('properties', {}))
+        
+        current_props = self._company_index['properties'].get(company_id) if self._company_index else None
+        if current_props is not None:
+            missing_props, different_props = self._diff_properties(safe_props, current_props, set(safe_props))
+            safe_props = {
+                key: value for key, value in safe_props.items()
+                if key in missing_props or key in different_props
+            }
+        
+        if not safe_props:
+            return False
+        
+        self._pending_company_updates.append({'id': company_id, 'properties': safe_props})
+        return True
+    
+    def _flush_company_updates(self) -> tuple[Set[str], Set[str]]:
+        """
+        Send queued company updates via batch update
+        
+        Returns the IDs written, and those whose echoed properties match what was sent
+        """
+        # Several production companies can resolve to the same sandbox company, and a batch
+        # holding a duplicate ID is rejected whole - merge them, later properties winning
+        merged = {}
+        for item in self._pending_company_updates:
+            merged.setdefault(str(item['id']), {}).update(item['properties'])
+        
+        pending = [{'id': company_id, 'properties': props} for company_id, props in merged.items()]
+        updated_ids = set()
+        confirmed_ids = set()
+        
+        self._pending_company_updates = []
+        
+        if pending:
+            logger.debug("🔧 Updating properties for %s companies...", len(pending))
+        
+        url = 'https://api.hubapi.com/crm/v3/objects/companies/batch/update'
+        
+        for start in range(0, len(pending), BATCH_SIZE):
+            chunk = pending[start:start + BATCH_SIZE]
+            
+            success, data = self._sandbox_request('POST', url, json_data={'inputs': chunk})
             
-        return migrated_count
+            if success:
+                results = data.get('results', [])
+            else:
+                # One bad input fails the whole batch, so retry the companies individually
+                logger.warning("⚠️  Batch company update failed, retrying companies individually: %s", data)
+                results = [result for result in self._map_concurrently(self._update_company_in_sandbox, chunk) if result]
+            
+            sent_props = {str(item['id']): item['properties'] for item in chunk}
+            for result in results:
+                company_id = str(result['id'])
+                updated_ids.add(company_id)
+                if company_id in sent_props and self._echo_confirms(sent_props[company_id], result.get('properties', {})):
+                    confirmed_ids.add(company_id)
+        
+        return updated_ids, confirmed_ids
     
-    def _find_company_by_domain(self, domain: str) -> Optional[str]:
-        """Find a company in sandbox by domain"""
-        headers = get_api_headers(self.sandbox_token)
-        search_url = 'https://api.hubapi.com/crm/v3/objects/companies/search'
+    def _update_company_in_sandbox(self, update: Dict[str, Any]) -> Optional[Dict]:
+        """Update a single sandbox company, returns the updated company or None on failure"""
+        url = f"https://api.hubapi.com/crm/v3/objects/companies/{update['id']}"
         
-        search_payload = {
-            'filterGroups': [{
-                'filters': [{
-                    'propertyName': 'domain',
-                    'operator': 'EQ',
-                    'value': domain
-                }]
-            }],
-            'properties': ['domain', 'name'],
-            'limit': 1
-        }
+        success, data = self._sandbox_request('PATCH', url, json_data={'properties': update['properties']})
         
-        success, search_data = make_hubspot_request('POST', search_url, headers, json_data=search_payload)
+        if not success:
+            logger.warning("❌ Failed to update company %s properties: %s", update['id'], data)
+            return None
         
-        if success:
-            results = search_data.get('results', [])
-            return results[0]['id'] if results else None
+        return data
+    
+    def _echo_confirms(self, sent_props: Dict[str, Any], echoed_props: Dict[str, Any]) -> bool:
+        """Whether a write response echoed back every property sent, with the same values"""
+        missing_props, different_props = self._diff_properties(sent_props, echoed_props, set(sent_props))
+        return not missing_props and not different_props
+    
+    def _list_sandbox_objects(self, object_type: str, properties: List[str], max_pages: int) -> Optional[List[Dict]]:
+        """
+        List every sandbox object of a type via the paginated list endpoint
+        
+        Returns None on failure, or when the sandbox holds more than max_pages pages of
+        them - past that, searching for each record is cheaper than listing them all.
+        """
+        url = f'https://api.hubapi.com/crm/v3/objects/{object_type}'
+        params = {'limit': 100, 'properties': ','.join(properties)}
+        objects = []
+        
+        for _ in range(max_pages):
+            success, data = self._sandbox_request('GET', url, params=params)
+            
+            if not success:
+                print(f"    ⚠️  Could not list sandbox {object_type}, falling back to search: {data}")
+                return None
+            
+            objects.extend(data.get('results', []))
+            
+            after = data.get('paging', {}).get('next', {}).get('after')
+            if not after:
+                return objects
+            
+            params = dict(params, after=after)
         
+        logger.debug("Sandbox has more than %s pages of %s, matching by search instead", max_pages, object_type)
         return None
     
-    def _find_company_by_name(self, name: str) -> Optional[str]:
-        """Find a company in sandbox by name"""
-        headers = get_api_headers(self.sandbox_token)
-        search_url = 'https://api.hubapi.com/crm/v3/objects/companies/search'
+    def _build_company_index(self, company_count: int) -> Optional[Dict[str, Any]]:
+        """Index existing sandbox companies by normalized domain, name, phone and name token
+        
+        Only built when listing the sandbox takes no more requests than searching for
+        each of the company_count companies being migrated, None otherwise.
+        """
+        # Fetch every migrated property so updates can skip companies that are already current
+        companies = self._list_sandbox_objects(
+            'companies', list(SAFE_COMPANY_PROPERTIES), min(company_count, SANDBOX_INDEX_MAX_PAGES)
+        )
         
-        search_payload = {
-            'filterGroups': [{
-                'filters': [{
-                    'propertyName': 'name',
-                    'operator': 'EQ',
-                    'value': name
-                }]
-            }],
-            'properties': ['domain', 'name'],
-            'limit': 1
-        }
+        if companies is None:
+            return None
         
-        success, search_data = make_hubspot_request('POST', search_url, headers, json_data=search_payload)
+        index = {'domain': {}, 'name': {}, 'phone': {}, 'token': {}, 'properties': {}}
+        
+        # The first listed (lowest ID) company wins; searches rank results differently, so
+        # duplicate sandbox companies may resolve to another one than a search would pick
+        for company in companies:
+            props = company.get('properties', {})
+            company_id = company['id']
+            index['properties'][company_id] = props
+            name = (props.get('name') or '').strip().lower()
+            
+            if props.get('domain'):
+                index['domain'].setdefault(self._normalize_domain(props['domain']), company_id)
+            if name:
+                index['name'].setdefault(name, company_id)
+                for token in set(name.replace(',', '').replace('.', '').split()):
+                    index['token'].setdefault(token, []).append(company)
+            if props.get('phone'):
+                normalized_phone = self._normalize_phone(props['phone'])
+                if normalized_phone:
+                    index['phone'].setdefault(normalized_phone, company_id)
+        
+        print(f"    📇 Indexed {len(companies)} existing sandbox companies")
+        return index
+    
+    def _build_deal_index(self, deal_count: int) -> Optional[Dict[str, List[tuple]]]:
+        """Index existing sandbox deals by lowercased name → [(amount, deal ID), ...]
         
-        if success:
-            results = search_data.get('results', [])
-            return results[0]['id'] if results else None
+        Only built when listing the sandbox takes no more requests than searching for
+        each of the deal_count deals being migrated, None otherwise.
+        """
+        deals = self._list_sandbox_objects('deals', ['dealname', 'amount'], min(deal_count, SANDBOX_INDEX_MAX_PAGES))
         
-        return None
+        if deals is None:
+            return None
+        
+        index = {}
+        for deal in deals:
+            props = deal.get('properties', {})
+            deal_name = (props.get('dealname') or '').strip().lower()
+            if deal_name:
+                index.setdefault(deal_name, []).append((props.get('amount'), deal['id']))
+        
+        print(f"    📇 Indexed {len(deals)} existing sandbox deals")
+        return index
+    
+    @staticmethod
+    def _amounts_equal(amount1: Any, amount2: Any) -> bool:
+        """Compare deal amounts numerically when possible ('100' == '100.0')"""
+        try:
+            return float(amount1) == float(amount2)
+        except (TypeError, ValueError):
+            return str(amount1 or '').strip() == str(amount2 or '').strip()
+    
+    def _find_company_by_domain(self, domain: str) -> Optional[str]:
+        """Find a company in sandbox by domain"""
+        if self._company_index is not None:
+            return self._company_index['domain'].get(self._normalize_domain(domain))
+        
+        return self._search_company_id('domain', domain)
+    
+    def _find_company_by_name(self, name: str) -> Optional[str]:
+        """Find a company in sandbox by name"""
+        if self._company_index is not None:
+            return self._company_index['name'].get(name.strip().lower())
+        
+        return self._search_company_id('name', name)
     
     def _create_company_in_sandbox(self, company: Dict[str, Any]) -> tuple[bool, str]:
         """Create a new company in sandbox with comprehensive properties"""
-        headers = get_api_headers(self.sandbox_token)
         url = 'https://api.hubapi.com/crm/v3/objects/companies'
         
         # Use comprehensive company properties
@@ -1337,7 +1948,7 @@ class SelectiveSyncManager:
         
         payload = {'properties': safe_company_props}
         
-        success, data = make_hubspot_request('POST', url, headers, json_data=payload)
+        success, data = self._sandbox_request('POST', url, json_data=payload)
         
         if success:
             return True, data.get('id', 'unknown')
@@ -1351,36 +1962,53 @@ class SelectiveSyncManager:
         
         migrated_count = 0
         deal_id_mapping = {}  # production_deal_id -> sandbox_deal_id
-        headers = get_api_headers(self.sandbox_token)
         
         try:
-            for i, deal in enumerate(deals, 1):
+            self._deal_index = self._build_deal_index(len(deals))
+            
+            # Deals sharing a name and amount resolve to the same sandbox deal, so only
+            # the first of each is looked up or created - concurrent workers would otherwise
+            # create it once per copy
+            leaders = {}  # match key → index of the first deal with that key
+            duplicates = {}  # deal index → leader index
+            
+            for i, deal in enumerate(deals):
+                match_key = self._deal_match_key(deal)
+                if match_key is None:
+                    continue
+                if match_key in leaders:
+                    duplicates[i] = leaders[match_key]
+                else:
+                    leaders[match_key] = i
+            
+            to_migrate = [i for i in range(len(deals)) if i not in duplicates]
+            
+            results = dict(zip(to_migrate, self._map_concurrently(self._migrate_deal, [deals[i] for i in to_migrate])))
+            
+            # Collected and written in one go rather than two flushed prints per deal
+            report_lines = []
+            
+            for i, deal in enumerate(deals):
                 deal_props = deal.get('properties', {})
                 deal_name = (deal_props.get('dealname') or '').strip()
                 amount = deal_props.get('amount', '')
-                stage = deal_props.get('dealstage', '')
-                production_deal_id = deal['id']
                 
-                print(f"    💼 [{i}/{len(deals)}] {deal_name} (${amount})")
+                if i in duplicates:
+                    sandbox_deal_id = results[duplicates[i]][0]
+                    message = (f"🔄 Already processed in this batch (ID: {sandbox_deal_id})"
+                               if sandbox_deal_id else "❌ Failed to create deal: earlier copy in this batch failed")
+                else:
+                    sandbox_deal_id, message = results[i]
                 
-                # Check if deal already exists in sandbox
-                existing_deal_id = self._find_deal_by_name_and_amount(deal_name, amount)
+                report_lines.append(f"    💼 [{i + 1}/{len(deals)}] {deal_name} (${amount})")
+                report_lines.append(f"      {message}")
                 
-                if existing_deal_id:
-                    print(f"      🔄 Deal already exists (ID: {existing_deal_id})")
-                    deal_id_mapping[production_deal_id] = existing_deal_id
+                if sandbox_deal_id:
+                    deal_id_mapping[deal['id']] = sandbox_deal_id
                     migrated_count += 1
-                else:
-                    # Create new deal
-                    success, new_deal_id = self._create_deal_in_sandbox(deal)
-                    if success:
-                        print(f"      ✅ Created new deal (ID: {new_deal_id})")
-                        deal_id_mapping[production_deal_id] = new_deal_id
-                        migrated_count += 1
-                    else:
-                        print(f"      ❌ Failed to create deal: {new_deal_id}")
-                
-                time.sleep(0.2)  # Rate limiting
+            
+            if report_lines:
+                print('\n'.join(report_lines))
             
             print(f"  ✅ Successfully migrated {migrated_count}/{len(deals)} deals")
             print(f"  📋 Deal ID mapping: {len(deal_id_mapping)} deals mapped")
@@ -1390,12 +2018,54 @@ class SelectiveSyncManager:
             
         return migrated_count, deal_id_mapping
     
+    def _deal_match_key(self, deal: Dict) -> Optional[tuple]:
+        """Key identifying deals that would match the same sandbox deal, None for unnamed deals"""
+        deal_props = deal.get('properties', {})
+        deal_name = (deal_props.get('dealname') or '').strip().lower()
+        
+        if not deal_name:
+            return None
+        
+        amount = deal_props.get('amount')
+        try:
+            amount = float(amount)
+        except (TypeError, ValueError):
+            amount = str(amount or '').strip()
+        
+        return deal_name, amount
+    
+    def _migrate_deal(self, deal: Dict) -> tuple[Optional[str], str]:
+        """Find or create one deal in sandbox, returns (sandbox ID or None, status message)"""
+        deal_props = deal.get('properties', {})
+        deal_name = (deal_props.get('dealname') or '').strip()
+        amount = deal_props.get('amount', '')
+        
+        # Check if deal already exists in sandbox
+        existing_deal_id = self._find_deal_by_name_and_amount(deal_name, amount)
+        
+        if existing_deal_id:
+            return existing_deal_id, f"🔄 Deal already exists (ID: {existing_deal_id})"
+        
+        # Create new deal
+        success, new_deal_id = self._create_deal_in_sandbox(deal)
+        
+        if success:
+            self._created_sandbox_ids['deals'].append(new_deal_id)
+            return new_deal_id, f"✅ Created new deal (ID: {new_deal_id})"
+        
+        return None, f"❌ Failed to create deal: {new_deal_id}"
+    
     def _find_deal_by_name_and_amount(self, deal_name: str, amount: str) -> Optional[str]:
         """Find a deal in sandbox by name and amount"""
         if not deal_name:
             return None
+        
+        if self._deal_index is not None:
+            for candidate_amount, deal_id in self._deal_index.get(deal_name.strip().lower(), []):
+                if not amount or self._amounts_equal(candidate_amount, amount):
+                    return deal_id
+            return None
             
-        headers = get_api_headers(self.sandbox_token)
         search_url = 'https://api.hubapi.com/crm/v3/objects/deals/search'
         
         # Primary filter: exact deal name match
@@ -1419,7 +2089,7 @@ class SelectiveSyncManager:
             'limit': 1
         }
         
-        success, search_data = make_hubspot_request('POST', search_url, headers, json_data=search_payload)
+        success, search_data = self._sandbox_request('POST', search_url, json_data=search_payload)
         
         if success:
             results = search_data.get('results', [])
@@ -1429,17 +2099,13 @@ class SelectiveSyncManager:
     
     def _create_deal_in_sandbox(self, deal: Dict[str, Any]) -> tuple[bool, str]:
         """Create a new deal in sandbox"""
-        headers = get_api_headers(self.sandbox_token)
         url = 'https://api.hubapi.com/crm/v3/objects/deals'
         
         # Filter properties to only include safe ones
         deal_props = deal.get('properties', {})
         
-        # Common deal properties that are usually safe
         safe_deal_props = {}
-        safe_fields = ['dealname', 'amount', 'dealstage', 'pipeline', 'closedate', 'createdate']
-        
-        for field in safe_fields:
+        for field in SAFE_DEAL_PROPERTIES:
             if field in deal_props and deal_props[field]:
                 safe_deal_props[field] = deal_props[field]
         
@@ -1452,7 +2118,7 @@ class SelectiveSyncManager:
         
         payload = {'properties': safe_deal_props}
         
-        success, data = make_hubspot_request('POST', url, headers, json_data=payload)
+        success, data = self._sandbox_request('POST', url, json_data=payload)
         
         if success:
             return True, data.get('id', 'unknown')
@@ -1465,52 +2131,108 @@ class SelectiveSyncManager:
         
         # Normalize domain for better matching
         normalized_domain = self._normalize_domain(domain) if domain else None
+        phone = (company_props.get('phone') or '').strip()
+        exact_name = name.strip() if name and len(name.strip()) > 2 else None
+        
+        if self._company_index is None:
+            # No index to consult - ask for domain, name and phone matches in one search
+            found, company_id = self._search_company_by_any(normalized_domain, exact_name, phone or None)
+            if found:
+                if company_id:
+                    return company_id
+                normalized_domain = exact_name = phone = None  # All three known to miss
         
         # Try domain first (most reliable) - use normalized domain
         if normalized_domain:
-            print(f"        🔍 Checking normalized domain: '{normalized_domain}'")
+            logger.debug("🔍 Checking normalized domain: '%s'", normalized_domain)
             company_id = self._find_company_by_domain(normalized_domain)
             if company_id:
-                print(f"        ✅ Found by domain: {company_id}")
+                logger.debug("✅ Found by domain: %s", company_id)
                 return company_id
-            print(f"        ❌ No match by domain")
+            logger.debug("❌ No match by domain")
         
         # Try exact name match (case-insensitive, trimmed)
-        if name and len(name.strip()) > 2:
-            normalized_name = name.strip()
-            print(f"        🔍 Checking exact name: '{normalized_name}'")
-            company_id = self._find_company_by_name(normalized_name)
+        if exact_name:
+            logger.debug("🔍 Checking exact name: '%s'", exact_name)
+            company_id = self._find_company_by_name(exact_name)
             if company_id:
-                print(f"        ✅ Found by exact name: {company_id}")
+                logger.debug("✅ Found by exact name: %s", company_id)
                 return company_id
-            print(f"        ❌ No match by exact name")
+            logger.debug("❌ No match by exact name")
         
-        # Try phone match (normalize phone numbers)
-        phone = (company_props.get('phone') or '').strip()
-        normalized_phone = self._normalize_phone(phone) if phone else None
-        if normalized_phone:
-            print(f"        🔍 Checking normalized phone: '{normalized_phone}'")
-            company_id = self._find_company_by_phone(normalized_phone)
+        # Try phone match (both the original and normalized formats)
+        if phone:
+            logger.debug("🔍 Checking phone: '%s'", phone)
+            company_id = self._find_company_by_phone(phone)
             if company_id:
-                print(f"        ✅ Found by phone: {company_id}")
+                logger.debug("✅ Found by phone: %s", company_id)
                 return company_id
-            print(f"        ❌ No match by phone")
+            logger.debug("❌ No match by phone")
         
         # Only try fuzzy matching for substantial names and as last resort
         if name and len(name.strip()) > 10:  # Only for longer, more distinctive names
-            print(f"        🔍 Checking fuzzy name match: '{name.strip()}'")
+            logger.debug("🔍 Checking fuzzy name match: '%s'", name.strip())
             company_id = self._find_company_by_fuzzy_name(name.strip())
             if company_id:
-                print(f"        ✅ Found by fuzzy name: {company_id}")
+                logger.debug("✅ Found by fuzzy name: %s", company_id)
                 return company_id
-            print(f"        ❌ No match by fuzzy name")
+            logger.debug("❌ No match by fuzzy name")
         
-        print(f"        ❌ No existing company found with any criteria")
+        logger.debug("❌ No existing company found with any criteria")
         return None
     
+    def _search_company_by_any(self, domain: Optional[str], name: Optional[str],
+                               phone: Optional[str]) -> tuple[bool, Optional[str]]:
+        """
+        Search sandbox for companies matching the domain, name or phone in one request
+        
+        Returns (False, None) if the search failed, otherwise (True, best match ID or None)
+        preferring a domain match over a name match over a phone match. The phone is
+        matched in both its original and normalized formats.
+        """
+        phone_variants = list(dict.fromkeys(p for p in (phone, self._normalize_phone(phone or '')) if p))
+        criteria = [(prop, value) for prop, value in (('domain', domain), ('name', name)) if value]
+        criteria += [('phone', phone_variant) for phone_variant in phone_variants]
+        if not criteria:
+            return True, None
+        
+        cache_key = ('any',) + tuple(criteria)
+        if cache_key in self._company_search_cache:
+            return True, self._company_search_cache[cache_key]
+        
+        search_url = 'https://api.hubapi.com/crm/v3/objects/companies/search'
+        
+        # Separate filter groups are ORed together
+        search_payload = {
+            'filterGroups': [
+                {'filters': [{'propertyName': prop, 'operator': 'EQ', 'value': value}]}
+                for prop, value in criteria
+            ],
+            'properties': ['domain', 'name', 'phone'],
+            'limit': 100
+        }
+        
+        success, search_data = self._sandbox_request('POST', search_url, json_data=search_payload)
+        
+        if not success:
+            return False, None
+        
+        results = search_data.get('results', [])
+        company_id = None
+        
+        for prop, value in criteria:
+            company_id = next((
+                result['id'] for result in results
+                if str(result.get('properties', {}).get(prop) or '').strip().lower() == value.lower()
+            ), None)
+            if company_id:
+                break
+        
+        self._company_search_cache[cache_key] = company_id
+        return True, company_id
+    
     def _find_company_by_fuzzy_name(self, name: str) -> Optional[str]:
         """Find company by intelligent partial name match with similarity scoring"""
-        headers = get_api_headers(self.sandbox_token)
         search_url = 'https://api.hubapi.com/crm/v3/objects/companies/search'
         
         # Extract key terms from company name (remove common words)
@@ -1521,6 +2243,10 @@ class SelectiveSyncManager:
         # Use the most significant term for search
         search_term = key_terms[0]
         
+        if self._company_index is not None:
+            best_match = self._find_best_company_match(name, self._company_index['token'].get(search_term, []))
+            return best_match['id'] if best_match else None
+        
         search_payload = {
             'filterGroups': [{
                 'filters': [{
@@ -1533,7 +2259,7 @@ class SelectiveSyncManager:
             'limit': 10  # Get more matches for better evaluation
         }
         
-        success, search_data = make_hubspot_request('POST', search_url, headers, json_data=search_payload)
+        success, search_data = self._sandbox_request('POST', search_url, json_data=search_payload)
         
         if success:
             results = search_data.get('results', [])
@@ -1542,7 +2268,7 @@ class SelectiveSyncManager:
                 best_match = self._find_best_company_match(name, results)
                 if best_match:
                     result_name = best_match.get('properties', {}).get('name', 'Unknown')
-                    print(f"        🎯 Best fuzzy match: '{result_name}' (similarity score applied)")
+                    logger.debug("🎯 Best fuzzy match: '%s' (similarity score applied)", result_name)
                     return best_match['id']
         
         return None
@@ -1556,8 +2282,9 @@ class SelectiveSyncManager:
         normalized_domain = self._normalize_domain(domain) if domain else ""
         normalized_phone = self._normalize_phone(phone) if phone else ""
         
-        # Primary key: name + domain
-        if normalized_name or normalized_domain:
+        # Name + domain key, only needed when neither the domain nor the name key below
+        # applies - any other name + domain match is already caught by one of them
+        if normalized_name and not normalized_domain and len(normalized_name) <= 3:
             keys.append(f"name_domain:{normalized_name}|{normalized_domain}")
         
         # Domain-only key (if domain exists)
@@ -1576,51 +2303,20 @@ class SelectiveSyncManager:
     
     def _normalize_domain(self, domain: str) -> str:
         """Normalize domain for consistent matching"""
-        if not domain:
-            return ""
-        
-        # Remove protocol and www
-        normalized = domain.lower().strip()
-        normalized = normalized.replace('http://', '').replace('https://', '')
-        normalized = normalized.replace('www.', '')
-        
-        # Remove trailing slash and path
-        normalized = normalized.split('/')[0]
-        
-        # Remove port numbers
-        normalized = normalized.split(':')[0]
-        
-        return normalized
+        return _normalize_domain(domain) if domain else ""
     
     def _normalize_phone(self, phone: str) -> str:
         """Normalize phone number for consistent matching"""
-        if not phone:
-            return ""
-        
-        # Remove all non-digit characters
-        digits_only = ''.join(filter(str.isdigit, phone))
-        
-        # For US numbers, remove leading 1 if present and length is 11
-        if len(digits_only) == 11 and digits_only.startswith('1'):
-            digits_only = digits_only[1:]
-        
-        return digits_only
+        return _normalize_phone(phone) if phone else ""
     
     def _extract_company_key_terms(self, name: str) -> List[str]:
         """Extract key terms from company name for fuzzy matching"""
         if not name:
             return []
         
-        # Common words to ignore in company names
-        stop_words = {
-            'inc', 'llc', 'ltd', 'corp', 'corporation', 'company', 'co', 'group', 
-            'the', 'and', 'of', 'for', 'in', 'on', 'at', 'to', 'a', 'an', 'is', 'are',
-            'services', 'service', 'solutions', 'enterprises', 'international', 'global'
-        }
-        
         # Split name into words and filter
         words = name.lower().replace(',', '').replace('.', '').split()
-        key_terms = [word for word in words if len(word) > 2 and word not in stop_words]
+        key_terms = [word for word in words if len(word) > 2 and word not in COMPANY_STOP_WORDS]
         
         # Sort by length (longer terms are usually more distinctive)
         key_terms.sort(key=len, reverse=True)
@@ -1650,6 +2346,9 @@ class SelectiveSyncManager:
             if score > 0.7 and score > best_score:
                 best_score = score
                 best_match = candidate
+                
+                if score == 1.0:
+                    break  # Exact match, nothing can score higher
         
         return best_match
     
@@ -1668,187 +2367,178 @@ class SelectiveSyncManager:
             longer = max(len(name1), len(name2))
             return shorter / longer * 0.9  # High score but not perfect
         
-        # Simple token-based similarity
-        tokens1 = set(name1.split())
-        tokens2 = set(name2.split())
+        # Simple token-based similarity (Jaccard over cached token sets)
+        tokens1 = _name_tokens(name1)
+        tokens2 = _name_tokens(name2)
         
         if not tokens1 or not tokens2:
             return 0.0
         
-        intersection = len(tokens1.intersection(tokens2))
-        union = len(tokens1.union(tokens2))
+        intersection = len(tokens1 & tokens2)
+        union = len(tokens1) + len(tokens2) - intersection
         
-        return intersection / union if union > 0 else 0.0
+        return intersection / union
     
     def _find_company_by_phone(self, phone: str) -> Optional[str]:
         """Find company by normalized phone number"""
         if not phone:
             return None
-            
-        headers = get_api_headers(self.sandbox_token)
-        search_url = 'https://api.hubapi.com/crm/v3/objects/companies/search'
         
+        if self._company_index is not None:
+            return self._company_index['phone'].get(self._normalize_phone(phone))
+            
         # Try both original and normalized phone formats
         phone_variants = [phone, self._normalize_phone(phone)]
         phone_variants = list(set([p for p in phone_variants if p]))  # Remove duplicates and empty
         
         for phone_variant in phone_variants:
-            search_payload = {
-                'filterGroups': [{
-                    'filters': [{
-                        'propertyName': 'phone',
-                        'operator': 'EQ',
-                        'value': phone_variant
-                    }]
-                }],
-                'properties': ['domain', 'name', 'phone'],
-                'limit': 1
-            }
-            
-            success, search_data = make_hubspot_request('POST', search_url, headers, json_data=search_payload)
-            
-            if success:
-                results = search_data.get('results', [])
-                if results:
-                    return results[0]['id']
+            company_id = self._search_company_id('phone', phone_variant)
+            if company_id:
+                return company_id
         
         return None
     
-    def _update_company_properties(self, company_id: str, original_company: Dict[str, Any]) -> bool:
-        """Update existing company with comprehensive properties"""
-        print(f"    🔧 Updating company properties for {company_id}...")
+    def _search_company_id(self, property_name: str, value: str) -> Optional[str]:
+        """Search sandbox for a company with an exact property value, caching the answer for this run"""
+        cache_key = (property_name, value)
+        if cache_key in self._company_search_cache:
+            return self._company_search_cache[cache_key]
         
-        headers = get_api_headers(self.sandbox_token)
-        url = f'https://api.hubapi.com/crm/v3/objects/companies/{company_id}'
+        search_url = 'https://api.hubapi.com/crm/v3/objects/companies/search'
         
-        # Get comprehensive company properties like we do for contacts
-        company_props = original_company.get('properties', {})
+        search_payload = {
+            'filterGroups': [{
+                'filters': [{
+                    'propertyName': property_name,
+                    'operator': 'EQ',
+                    'value': value
+                }]
+            }],
+            'properties': ['domain', 'name', 'phone'],
+            'limit': 1
+        }
         
-        # Filter and prepare properties for update
-        safe_props = self._get_safe_company_properties(company_props)
+        success, search_data = self._sandbox_request('POST', search_url, json_data=search_payload)
         
-        if not safe_props:
-            print(f"    ℹ️  No properties to update")
-            return True
+        if not success:
+            return None  # Don't cache failures, a later lookup may succeed
         
-        payload = {'properties': safe_props}
+        results = search_data.get('results', [])
+        company_id = results[0]['id'] if results else None
+        self._company_search_cache[cache_key] = company_id
         
-        success, data = make_hubspot_request('PATCH', url, headers, json_data=payload)
+        return company_id
+    
+    def _cache_created_company(self, company_id: str, company_props: Dict[str, Any]) -> None:
+        """Point cached company searches at a newly created company, replacing misses recorded before it existed"""
+        domain = (company_props.get('domain') or '').strip()
+        name = (company_props.get('name') or '').strip()
+        phone = (company_props.get('phone') or '').strip()
         
-        if success:
-            print(f"    ✅ Updated {len(safe_props)} company properties")
-            return True
-        else:
-            print(f"    ❌ Failed to update company properties: {data}")
-            return False
+        # Keyed the way _find_existing_company and _find_company_by_phone search
+        created_keys = set()
+        if domain:
+            created_keys.add(('domain', self._normalize_domain(domain)))
+        if name:
+            created_keys.add(('name', name))
+        for phone_variant in (phone, self._normalize_phone(phone)):
+            if phone_variant:
+                created_keys.add(('phone', phone_variant))
+        
+        # Search EQ matches ignore case, so a miss cached under another casing is stale too
+        created_lower = {(prop, value.lower()) for prop, value in created_keys}
+        
+        for cache_key, cached_id in list(self._company_search_cache.items()):
+            criteria = cache_key[1:] if cache_key[0] == 'any' else (cache_key,)
+            if cached_id is None and any((prop, value.lower()) in created_lower for prop, value in criteria):
+                del self._company_search_cache[cache_key]
+        
+        for cache_key in created_keys:
+            if self._company_search_cache.get(cache_key) is None:
+                self._company_search_cache[cache_key] = company_id
     
     def _get_safe_company_properties(self, company_props: Dict[str, Any]) -> Dict[str, Any]:
         """Get comprehensive list of safe company properties to migrate"""
-        
-        # Comprehensive list of commonly safe company properties
-        safe_fields = [
-            'name', 'domain', 'city', 'state', 'country', 'industry', 'phone', 'website',
-            'description', 'founded_year', 'is_public', 'timezone', 'type', 'zip',
-            'address', 'address2', 'annualrevenue', 'numberofemployees', 'owneremail',
-            'facebookcompanypage', 'linkedincompanypage', 'twitterhandle', 
-            'googleplus_page', 'about_us', 'facebook_company_page'
-        ]
-        
-        safe_props = {}
-        for field in safe_fields:
-            if field in company_props and company_props[field]:
-                safe_props[field] = company_props[field]
-        
-        return safe_props
+        # Walk the short safe list rather than every property on the record
+        return {field: company_props[field] for field in SAFE_COMPANY_PROPERTIES if company_props.get(field)}
     
-    def _verify_and_fix_company_properties(self, sandbox_company_id: str, original_company: Dict[str, Any]) -> bool:
-        """Verify all company properties were transferred correctly and fix missing ones"""
-        print(f"    🔍 Verifying properties for company {sandbox_company_id}...")
-        
-        headers = get_api_headers(self.sandbox_token)
-        sandbox_url = f'https://api.hubapi.com/crm/v3/objects/companies/{sandbox_company_id}'
+    def _verify_and_fix_companies_bulk(self, mapping: Dict[str, Dict]) -> int:
+        """Verify migrated companies in bulk and fix missing properties with batch updates
         
-        # Get comprehensive properties for comparison
-        original_props = original_company.get('properties', {})
-        safe_props_dict = self._get_safe_company_properties(original_props)
-        safe_props_list = list(safe_props_dict.keys())
-        
-        if not safe_props_list:
-            print(f"    ℹ️  No properties to verify")
-            return True
+        mapping is sandbox company ID → original production company.
+        Returns the number of companies that verified cleanly or were fixed.
+        """
+        if not mapping:
+            return 0
         
-        print(f"    🔍 Checking {len(safe_props_list)} properties: {', '.join(safe_props_list[:5])}{'...' if len(safe_props_list) > 5 else ''}")
+        print(f"  🔍 Verifying properties for {len(mapping)} companies...")
         
-        params = {
-            'properties': ','.join(safe_props_list)
+        # Only the safe properties present on the originals need checking
+        expected_props = {
+            sandbox_id: self._get_safe_company_properties(original.get('properties', {}))
+            for sandbox_id, original in mapping.items()
         }
+        # Companies with nothing to check verify trivially and are not read back
+        verified_count = len(expected_props)
+        expected_props = {sandbox_id: props for sandbox_id, props in expected_props.items() if props}
+        verified_count -= len(expected_props)
+        props_to_read = list(dict.fromkeys(name for props in expected_props.values() for name in props))
         
-        success, sandbox_data = make_hubspot_request('GET', sandbox_url, headers, params=params)
-        
-        if not success:
-            print(f"    ❌ Could not fetch sandbox company data for verification")
-            return False
+        if not props_to_read:
+            print(f"    ℹ️  No properties to verify")
+            return len(mapping)
         
-        # Compare properties
-        sandbox_props = sandbox_data.get('properties', {})
+        sandbox_props_by_id = self._read_sandbox_properties('companies', list(expected_props), props_to_read)
         
-        missing_props = {}
-        different_props = {}
+        fixes = []
         
-        for prop_name, prop_value in original_props.items():
-            if prop_name in safe_props_list and prop_value:  # Only check non-empty values
-                sandbox_value = sandbox_props.get(prop_name)
-                
-                if not sandbox_value:
-                    missing_props[prop_name] = prop_value
-                elif str(sandbox_value).strip() != str(prop_value).strip():
-                    different_props[prop_name] = {
-                        'original': prop_value,
-                        'sandbox': sandbox_value
-                    }
-        
-        # Report findings
-        if missing_props or different_props:
-            print(f"    ⚠️  Property verification issues found:")
+        for sandbox_id, safe_props in expected_props.items():
+            sandbox_props = sandbox_props_by_id.get(str(sandbox_id))
+            
+            if sandbox_props is None:
+                print(f"    ❌ Could not fetch sandbox company {sandbox_id} for verification")
+                continue
+            
+            missing_props, different_props = self._diff_properties(safe_props, sandbox_props, set(safe_props))
+            
+            if not missing_props and not different_props:
+                verified_count += 1
+                continue
+            
+            print(f"    ⚠️  Company {sandbox_id}: {len(missing_props)} missing, {len(different_props)} different properties")
+            
+            for prop, value in list(missing_props.items())[:3]:  # Show first 3
+                print(f"        • {prop}: {str(value)[:50]}")
+            if len(missing_props) > 3:
+                print(f"        ... and {len(missing_props)-3} more")
+            
+            for prop, values in list(different_props.items())[:2]:  # Show first 2
+                print(f"        • {prop}: '{values['original']}' vs '{values['sandbox']}'")
             
             if missing_props:
-                print(f"      📋 Missing properties: {len(missing_props)}")
-                for prop, value in list(missing_props.items())[:3]:  # Show first 3
-                    print(f"        • {prop}: {str(value)[:50]}")
-                if len(missing_props) > 3:
-                    print(f"        ... and {len(missing_props)-3} more")
-            
-            if different_props:
-                print(f"      🔄 Different values: {len(different_props)}")
-                for prop, values in list(different_props.items())[:2]:  # Show first 2
-                    print(f"        • {prop}: '{values['original']}' vs '{values['sandbox']}'")
-        
-        # Fix missing properties
-        if missing_props:
-            print(f"    🔧 Fixing {len(missing_props)} missing company properties...")
-            
-            update_payload = {'properties': missing_props}
-            update_success, update_result = make_hubspot_request('PATCH', sandbox_url, headers, json_data=update_payload)
-            
-            if update_success:
-                print(f"    ✅ Successfully updated {len(missing_props)} properties")
-                return True
+                fixes.append({'id': sandbox_id, 'properties': missing_props})
             else:
-                print(f"    ❌ Failed to update properties: {update_result}")
-                return False
-        else:
-            print(f"    ✅ All company properties verified successfully")
-            return True
+                verified_count += 1
+        
+        if fixes:
+            print(f"    🔧 Fixing missing properties on {len(fixes)} companies...")
+            fixed_count = self._batch_update_objects('companies', fixes)
+            verified_count += fixed_count
+            print(f"    ✅ Updated {fixed_count}/{len(fixes)} companies")
+        
+        print(f"  ✅ Verified {verified_count}/{len(mapping)} companies")
+        return verified_count
     
     def _create_selective_associations(self, contact_ids: List[str], deal_ids: List[str], company_ids: List[str], deal_id_mapping: Dict[str, str] = None) -> int:
         """Create associations between migrated objects using proper association API"""
         print(f"  🔗 Creating associations between migrated objects...")
         
         associations_created = 0
-        headers = get_api_headers(self.sandbox_token)
+        contact_ids = list(dict.fromkeys(contact_ids))
         
         # Get the mapping of old IDs to new sandbox IDs
         old_to_new_contacts = self._get_contact_id_mapping(contact_ids)
+        mapped_contact_ids = [contact_id for contact_id in contact_ids if contact_id in old_to_new_contacts]
         
         # Use the provided deal mapping instead of searching again
         old_to_new_deals = deal_id_mapping if deal_id_mapping else {}
@@ -1861,224 +2551,208 @@ class SelectiveSyncManager:
         if old_to_new_contacts and old_to_new_companies:
             print(f"    🏢 Creating contact-to-company associations...")
             
-            # Get original associations from production
-            for prod_contact_id in contact_ids:
-                if prod_contact_id in old_to_new_contacts:
-                    sandbox_contact_id = old_to_new_contacts[prod_contact_id]
-                    
-                    # Find companies associated with this contact in production
-                    prod_headers = get_api_headers(self.prod_token)
-                    assoc_url = f'https://api.hubapi.com/crm/v3/objects/contacts/{prod_contact_id}/associations/companies'
-                    
-                    success, assoc_data = make_hubspot_request('GET', assoc_url, prod_headers)
-                    
-                    if success:
-                        prod_company_ids = [result['id'] for result in assoc_data.get('results', [])]
-                        
-                        # Create associations in sandbox
-                        for prod_company_id in prod_company_ids:
-                            if prod_company_id in old_to_new_companies:
-                                sandbox_company_id = old_to_new_companies[prod_company_id]
-                                
-                                if self._create_association(sandbox_contact_id, sandbox_company_id, 'contacts', 'companies'):
-                                    associations_created += 1
-                    
-                    time.sleep(0.1)  # Rate limiting
+            # Get original associations from production, ASSOCIATION_READ_BATCH_SIZE contacts per request
+            contact_to_companies = self._batch_read_associations('contacts', 'companies', mapped_contact_ids)
+            
+            pairs = [
+                (old_to_new_contacts[prod_contact_id], old_to_new_companies[prod_company_id])
+                for prod_contact_id in mapped_contact_ids
+                for prod_company_id in contact_to_companies.get(prod_contact_id, [])
+                if prod_company_id in old_to_new_companies
+            ]
+            
+            # Create associations in sandbox
+            associations_created += self._batch_create_associations('contacts', 'companies', pairs)
         
         # Create contact-to-deal associations  
         if old_to_new_contacts and old_to_new_deals:
             print(f"    💼 Creating contact-to-deal associations...")
             
-            # Get original associations from production
-            for prod_contact_id in contact_ids:
-                if prod_contact_id in old_to_new_contacts:
-                    sandbox_contact_id = old_to_new_contacts[prod_contact_id]
-                    
-                    # Find deals associated with this contact in production
-                    prod_headers = get_api_headers(self.prod_token)
-                    assoc_url = f'https://api.hubapi.com/crm/v3/objects/contacts/{prod_contact_id}/associations/deals'
-                    
-                    success, assoc_data = make_hubspot_request('GET', assoc_url, prod_headers)
-                    
-                    if success:
-                        prod_deal_ids = [result['id'] for result in assoc_data.get('results', [])]
-                        
-                        # Create associations in sandbox
-                        for prod_deal_id in prod_deal_ids:
-                            if prod_deal_id in old_to_new_deals:
-                                sandbox_deal_id = old_to_new_deals[prod_deal_id]
-                                
-                                if self._create_association(sandbox_contact_id, sandbox_deal_id, 'contacts', 'deals'):
-                                    associations_created += 1
-                    
-                    time.sleep(0.1)  # Rate limiting
+            # Get original associations from production, ASSOCIATION_READ_BATCH_SIZE contacts per request
+            contact_to_deals = self._batch_read_associations('contacts', 'deals', mapped_contact_ids)
+            
+            pairs = [
+                (old_to_new_contacts[prod_contact_id], old_to_new_deals[prod_deal_id])
+                for prod_contact_id in mapped_contact_ids
+                for prod_deal_id in contact_to_deals.get(prod_contact_id, [])
+                if prod_deal_id in old_to_new_deals
+            ]
+            
+            # Create associations in sandbox
+            associations_created += self._batch_create_associations('contacts', 'deals', pairs)
         
         print(f"  ✅ Created {associations_created} associations successfully")
         return associations_created
     
     def _get_contact_id_mapping(self, prod_contact_ids: List[str]) -> Dict[str, str]:
         """Get mapping from production contact IDs to sandbox contact IDs"""
-        mapping = {}
+        # Contacts migrated in this run already know their sandbox ID
+        mapping = {
+            prod_id: self._contact_id_mapping[prod_id]
+            for prod_id in prod_contact_ids if prod_id in self._contact_id_mapping
+        }
+        remaining_ids = [prod_id for prod_id in prod_contact_ids if prod_id not in mapping]
+        
+        if not remaining_ids:
+            return mapping
+        
+        # Get emails from production contacts
+        prod_emails = {}  # production contact ID → lowercased email
+        for contact in self._batch_read_objects('contacts', remaining_ids, ['email']):
+            email = (contact.get('properties', {}).get('email') or '').strip().lower()
+            if email:
+                prod_emails[str(contact['id'])] = email
+        
+        # Look the emails up in sandbox, 100 per request
+        emails = list(dict.fromkeys(prod_emails.values()))
+        sandbox_ids = {}  # lowercased email → sandbox contact ID
+        for start in range(0, len(emails), BATCH_SIZE):
+            sandbox_ids.update(self._batch_find_contacts_by_email(emails[start:start + BATCH_SIZE]))
+        
+        mapping.update(
+            (prod_id, sandbox_ids[email])
+            for prod_id, email in prod_emails.items()
+            if email in sandbox_ids
+        )
         
-        # Import contact search function
-        sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'migrations'))
-        from contact_migration import find_contact_by_email
+        return mapping
+    
+    def _get_company_id_mapping(self, prod_company_ids: List[str]) -> Dict[str, str]:
+        """Get mapping from production company IDs to sandbox company IDs"""
+        # Companies migrated in this run already know their sandbox ID
+        mapping = {
+            prod_id: self._company_id_mapping[prod_id]
+            for prod_id in prod_company_ids if prod_id in self._company_id_mapping
+        }
+        remaining_ids = [prod_id for prod_id in prod_company_ids if prod_id not in mapping]
+        
+        if not remaining_ids:
+            return mapping
+        
+        # Get company domains from production, then search sandbox by domain (or name without one)
+        prod_companies = self._batch_read_objects('companies', remaining_ids, ['domain', 'name'])
+        lookup = {}  # production company ID → (property, lowercased value)
+        for company in prod_companies:
+            props = company.get('properties', {})
+            if props.get('domain'):
+                lookup[str(company['id'])] = ('domain', props['domain'].strip().lower())
+            elif props.get('name'):
+                lookup[str(company['id'])] = ('name', props['name'].strip().lower())
+        
+        sandbox_ids = {}  # (property, lowercased value) → sandbox company ID, first match wins
+        for property_name in ('domain', 'name'):
+            values = [value for prop, value in lookup.values() if prop == property_name]
+            for company in self._search_sandbox_in('companies', property_name, values, ['domain', 'name']):
+                value = (company.get('properties', {}).get(property_name) or '').strip().lower()
+                sandbox_ids.setdefault((property_name, value), company['id'])
+        
+        for prod_id, key in lookup.items():
+            if key in sandbox_ids:
+                mapping[prod_id] = sandbox_ids[key]
         
-        prod_headers = get_api_headers(self.prod_token)
+        return mapping
+    
+    def _search_sandbox_in(self, object_type: str, property_name: str, values: List[str],
+                           properties: List[str]) -> List[Dict]:
+        """
+        Search sandbox for objects whose property is any of the values, 100 values per request
+        
+        String values should be lowercase, as the search API's IN operator expects.
+        """
+        url = f'https://api.hubapi.com/crm/v3/objects/{object_type}/search'
+        values = list(dict.fromkeys(values))
+        objects = []
         
-        for prod_id in prod_contact_ids:
-            # Get email from production contact
-            prod_url = f'https://api.hubapi.com/crm/v3/objects/contacts/{prod_id}'
-            success, prod_data = make_hubspot_request('GET', prod_url, prod_headers, params={'properties': 'email'})
-            
-            if success:
-                email = prod_data.get('properties', {}).get('email')
-                if email:
-                    sandbox_id = find_contact_by_email(self.sandbox_token, email)
-                    if sandbox_id:
-                        mapping[prod_id] = sandbox_id
+        for start in range(0, len(values), BATCH_SIZE):
+            payload = {
+                'filterGroups': [{
+                    'filters': [{
+                        'propertyName': property_name,
+                        'operator': 'IN',
+                        'values': values[start:start + BATCH_SIZE]
+                    }]
+                }],
+                'properties': properties
+            }
             
-            time.sleep(0.1)  # Rate limiting
+            for page_results in self._iter_search_pages(url, payload, sandbox=True):
+                objects.extend(page_results)
         
-        return mapping
+        return objects
     
-    def _get_deal_id_mapping(self, prod_deal_ids: List[str]) -> Dict[str, str]:
-        """Get mapping from production deal IDs to sandbox deal IDs"""
-        mapping = {}
+    def _batch_create_associations(self, from_type: str, to_type: str, pairs: List[tuple]) -> int:
+        """Create (from ID, to ID) associations in sandbox, up to 100 per request, returns the number in place"""
+        pairs = list(dict.fromkeys(pairs))
         
-        prod_headers = get_api_headers(self.prod_token)
-        sandbox_headers = get_api_headers(self.sandbox_token)
+        # Skip associations the sandbox already has, so re-runs send no create requests
+        existing = self._batch_read_associations(
+            from_type, to_type, list(dict.fromkeys(from_id for from_id, _ in pairs)), sandbox=True
+        )
+        existing_pairs = {(from_id, to_id) for from_id, to_ids in existing.items() for to_id in to_ids}
+        pairs_to_create = [pair for pair in pairs if (str(pair[0]), str(pair[1])) not in existing_pairs]
+        already_present = len(pairs) - len(pairs_to_create)
+        created_count = 0
+        
+        type_id = self._get_association_type_id(from_type, to_type) if pairs_to_create else None
+        
+        if type_id is not None:
+            # v4 takes the numeric type ID, so the server needn't resolve a type name per input
+            batch_url = f'https://api.hubapi.com/crm/v4/associations/{from_type}/{to_type}/batch/create'
+            type_field = {"types": [{"associationCategory": "HUBSPOT_DEFINED", "associationTypeId": type_id}]}
+        else:
+            batch_url = f'https://api.hubapi.com/crm/v3/associations/{from_type}/{to_type}/batch/create'
+            type_field = {"type": ASSOCIATION_TYPES[(from_type, to_type)]}
         
-        for prod_id in prod_deal_ids:
-            # Get deal details from production
-            prod_url = f'https://api.hubapi.com/crm/v3/objects/deals/{prod_id}'
-            success, prod_data = make_hubspot_request('GET', prod_url, prod_headers, params={'properties': 'dealname,amount,createdate'})
+        for start in range(0, len(pairs_to_create), BATCH_SIZE):
+            chunk = pairs_to_create[start:start + BATCH_SIZE]
+            payload = {
+                "inputs": [
+                    {"from": {"id": from_id}, "to": {"id": to_id}, **type_field}
+                    for from_id, to_id in chunk
+                ]
+            }
+            
+            success, result = self._sandbox_request('POST', batch_url, json_data=payload)
             
             if success:
-                deal_name = prod_data.get('properties', {}).get('dealname', '').strip()
-                amount = prod_data.get('properties', {}).get('amount')
-                
-                if deal_name:
-                    # Search for deal in sandbox by name and amount
-                    search_url = 'https://api.hubapi.com/crm/v3/objects/deals/search'
-                    
-                    # Primary filter: exact deal name match
-                    filters = [{
-                        'propertyName': 'dealname',
-                        'operator': 'EQ',
-                        'value': deal_name
-                    }]
-                    
-                    # Secondary filter: amount if available
-                    if amount:
-                        filters.append({
-                            'propertyName': 'amount',
-                            'operator': 'EQ',
-                            'value': amount
-                        })
-                    
-                    search_payload = {
-                        'filterGroups': [{'filters': filters}],
-                        'properties': ['dealname', 'amount', 'createdate'],
-                        'limit': 1
-                    }
-                    
-                    search_success, search_data = make_hubspot_request('POST', search_url, sandbox_headers, json_data=search_payload)
-                    
-                    if search_success:
-                        results = search_data.get('results', [])
-                        if results:
-                            sandbox_deal = results[0]
-                            sandbox_id = sandbox_deal['id']
-                            mapping[prod_id] = sandbox_id
-                            print(f"      🔗 Mapped deal '{deal_name}' ({prod_id} → {sandbox_id})")
-                        else:
-                            # Try fuzzy matching by name only if exact match failed
-                            name_only_filters = [{
-                                'propertyName': 'dealname',
-                                'operator': 'CONTAINS_TOKEN',
-                                'value': deal_name
-                            }]
-                            
-                            fuzzy_payload = {
-                                'filterGroups': [{'filters': name_only_filters}],
-                                'properties': ['dealname', 'amount', 'createdate'],
-                                'limit': 5  # Get top 5 potential matches
-                            }
-                            
-                            fuzzy_success, fuzzy_data = make_hubspot_request('POST', search_url, sandbox_headers, json_data=fuzzy_payload)
-                            
-                            if fuzzy_success:
-                                fuzzy_results = fuzzy_data.get('results', [])
-                                # Take the first fuzzy match if available
-                                if fuzzy_results:
-                                    best_match = fuzzy_results[0]
-                                    sandbox_id = best_match['id']
-                                    mapping[prod_id] = sandbox_id
-                                    print(f"      🔗 Fuzzy mapped deal '{deal_name}' ({prod_id} → {sandbox_id})")
-                                else:
-                                    print(f"      ❌ No match found for deal '{deal_name}' ({prod_id})")
-                            else:
-                                print(f"      ❌ Fuzzy search failed for deal '{deal_name}' ({prod_id})")
-                    else:
-                        print(f"      ❌ Search failed for deal '{deal_name}' ({prod_id}): {search_data}")
-                else:
-                    print(f"      ⚠️  Deal {prod_id} has no name, skipping mapping")
+                # A 207 lists the inputs that failed under 'errors'
+                created_count += len(chunk) - len(result.get('errors', [])) if isinstance(result, dict) else len(chunk)
             else:
-                print(f"      ❌ Failed to fetch production deal {prod_id}: {prod_data}")
-            
-            time.sleep(0.1)  # Rate limiting
+                # Retry one by one so existing associations and bad IDs are reported individually
+                print(f"      ⚠️  Batch association create failed, retrying individually: {result}")
+                for from_id, to_id in chunk:
+                    if self._create_association(from_id, to_id, from_type, to_type):
+                        created_count += 1
         
-        print(f"    📋 Deal mapping: {len(mapping)}/{len(prod_deal_ids)} deals mapped")
-        return mapping
-    
-    def _get_company_id_mapping(self, prod_company_ids: List[str]) -> Dict[str, str]:
-        """Get mapping from production company IDs to sandbox company IDs"""
-        mapping = {}
+        print(f"      🔗 Created {created_count}/{len(pairs_to_create)} {from_type} → {to_type} associations"
+              f" ({already_present} already present)")
         
-        prod_headers = get_api_headers(self.prod_token)
-        sandbox_headers = get_api_headers(self.sandbox_token)
+        # Existing associations count as in place, as a 409 from the create call always did
+        return created_count + already_present
+    
+    def _get_association_type_id(self, from_type: str, to_type: str) -> Optional[int]:
+        """Look up (once per pair) the unlabeled HubSpot-defined association type ID, None if unavailable"""
+        key = (from_type, to_type)
         
-        for prod_id in prod_company_ids:
-            # Get company domain from production
-            prod_url = f'https://api.hubapi.com/crm/v3/objects/companies/{prod_id}'
-            success, prod_data = make_hubspot_request('GET', prod_url, prod_headers, params={'properties': 'domain,name'})
+        if key not in self._association_type_ids:
+            url = f'https://api.hubapi.com/crm/v4/associations/{from_type}/{to_type}/labels'
+            success, data = self._sandbox_request('GET', url)
             
+            type_id = None
             if success:
-                domain = prod_data.get('properties', {}).get('domain')
-                name = prod_data.get('properties', {}).get('name')
-                
-                if domain or name:
-                    # Search for company in sandbox by domain or name
-                    search_url = 'https://api.hubapi.com/crm/v3/objects/companies/search'
-                    
-                    filters = []
-                    if domain:
-                        filters.append({'propertyName': 'domain', 'operator': 'EQ', 'value': domain})
-                    elif name:
-                        filters.append({'propertyName': 'name', 'operator': 'EQ', 'value': name})
-                    
-                    if filters:
-                        search_payload = {
-                            'filterGroups': [{'filters': filters}],
-                            'properties': ['domain', 'name'],
-                            'limit': 1
-                        }
-                        
-                        search_success, search_data = make_hubspot_request('POST', search_url, sandbox_headers, json_data=search_payload)
-                        
-                        if search_success:
-                            results = search_data.get('results', [])
-                            if results:
-                                mapping[prod_id] = results[0]['id']
-            
-            time.sleep(0.1)  # Rate limiting
+                defined = [label for label in data.get('results', []) if label.get('category') == 'HUBSPOT_DEFINED']
+                # Prefer the default unlabeled type over labeled ones such as "Primary"
+                default = next((label for label in defined if not label.get('label')), defined[0] if defined else None)
+                type_id = default.get('typeId') if default else None
+            else:
+                print(f"      ⚠️  Could not read {from_type} → {to_type} association types, using v3 names: {data}")
+            
+            self._association_type_ids[key] = type_id
         
-        return mapping
+        return self._association_type_ids[key]
     
     def _create_association(self, from_object_id: str, to_object_id: str, from_type: str, to_type: str) -> bool:
         """Create an association between two objects using HubSpot batch associations API"""
-        headers = get_api_headers(self.sandbox_token)
         
         # Try using the batch associations API which is more reliable
         # This API allows creating multiple associations at once but we'll use it for single ones too
@@ -2094,19 +2768,14 @@ class SelectiveSyncManager:
                     "to": {
                         "id": to_object_id
                     },
-                    "type": "contact_to_deal" if from_type == "contacts" and to_type == "deals" else 
-                            "deal_to_contact" if from_type == "deals" and to_type == "contacts" else
-                            "contact_to_company" if from_type == "contacts" and to_type == "companies" else
-                            "company_to_contact" if from_type == "companies" and to_type == "contacts" else
-                            "company_to_deal" if from_type == "companies" and to_type == "deals" else
-                            "deal_to_company"
+                    "type": ASSOCIATION_TYPES[(from_type, to_type)]
                 }
             ]
         }
         
-        print(f"      🔗 Creating {from_type} {from_object_id} → {to_type} {to_object_id}")
+        logger.debug("🔗 Creating %s %s → %s %s", from_type, from_object_id, to_type, to_object_id)
         
-        success, result = make_hubspot_request('POST', batch_url, headers, json_data=payload)
+        success, result = self._sandbox_request('POST', batch_url, json_data=payload)
         
         if success:
             # Check if the association was created
@@ -2114,12 +2783,12 @@ class SelectiveSyncManager:
                 status = result.get('status', 'COMPLETE')
                 results_list = result.get('results', [])
                 if results_list and len(results_list) > 0:
-                    print(f"      ✅ Association created successfully")
+                    logger.debug("✅ Association created successfully")
                     return True
                 elif status == 'COMPLETE':
-                    print(f"      ✅ Association created")
+                    logger.debug("✅ Association created")
                     return True
-            print(f"      ✅ Association request completed")
+            logger.debug("✅ Association request completed")
             return True
         else:
             # Check for specific error codes
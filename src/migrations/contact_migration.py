@@ -8,10 +8,11 @@ import time
 from typing import List, Dict, Any, Optional
 import sys
 import os
+import requests
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from utils.utils import (
-    load_env_config, get_api_headers, make_hubspot_request, print_progress_bar
+    load_env_config, get_api_headers, make_hubspot_request, print_progress_bar, RateLimiter
 )
 from core.field_filters import HubSpotFieldFilter
 
@@ -131,8 +132,10 @@ def find_contact_by_email(token: str, email: str) -> Optional[str]:
     else:
         return None
 
-def create_contact_in_sandbox(token: str, contact_data: Dict[str, Any], filter_system: HubSpotFieldFilter) -> tuple[bool, str]:
-    """Create a new contact in sandbox"""
+def create_contact_in_sandbox(token: str, contact_data: Dict[str, Any], filter_system: HubSpotFieldFilter,
+                              session: Optional[requests.Session] = None,
+                              rate_limiter: Optional[RateLimiter] = None) -> tuple[bool, str]:
+    """Create a new contact in sandbox, optionally through a caller's session and rate limiter"""
     headers = get_api_headers(token)
     url = 'https://api.hubapi.com/crm/v3/objects/contacts'
     
@@ -141,15 +144,19 @@ def create_contact_in_sandbox(token: str, contact_data: Dict[str, Any], filter_s
     
     payload = {'properties': properties}
     
-    success, data = make_hubspot_request('POST', url, headers, json_data=payload)
+    success, data = make_hubspot_request('POST', url, headers, json_data=payload,
+                                         session=session, rate_limiter=rate_limiter)
     
-    if success:
-        return True, data.get('id', 'unknown')
+    # A 409 conflict comes back as success with an error body and no ID
+    if success and data.get('id'):
+        return True, data['id']
     else:
         error_msg = data.get('error', str(data)) if isinstance(data, dict) else str(data)
         return False, error_msg
 
-def update_contact_in_sandbox(token: str, contact_id: str, contact_data: Dict[str, Any], filter_system: HubSpotFieldFilter) -> tuple[bool, int]:
+def update_contact_in_sandbox(token: str, contact_id: str, contact_data: Dict[str, Any], filter_system: HubSpotFieldFilter,
+                              session: Optional[requests.Session] = None,
+                              rate_limiter: Optional[RateLimiter] = None) -> tuple[bool, int]:
     """Update an existing contact in sandbox with filtered properties only"""
     headers = get_api_headers(token)
     url = f'https://api.hubapi.com/crm/v3/objects/contacts/{contact_id}'
@@ -162,7 +169,8 @@ def update_contact_in_sandbox(token: str, contact_id: str, contact_data: Dict[st
     
     payload = {'properties': properties}
     
-    success, data = make_hubspot_request('PATCH', url, headers, json_data=payload)
+    success, data = make_hubspot_request('PATCH', url, headers, json_data=payload,
+                                         session=session, rate_limiter=rate_limiter)
     
     if success:
         return True, len(properties)
@@ -4,13 +4,31 @@ Common utilities and helper functions
 """
 
 import os
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import random
+import threading
 import time
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple, Union
 from pathlib import Path
 
+try:
+    import orjson  # Optional: much faster JSON encoding/decoding for large payloads
+except ImportError:
+    orjson = None
+
+# Shared pooled session for requests made without a portal-specific session
+_default_session: Optional[requests.Session] = None
+_default_session_lock = threading.Lock()
+
+# One rate limiter per access token, since HubSpot enforces its quota per token
+_rate_limiters: Dict[str, 'RateLimiter'] = {}
+_rate_limiters_lock = threading.Lock()
+
 def setup_logging(level: str = 'INFO', log_to_file: bool = True, log_directory: str = 'logs'):
     """Setup logging configuration"""
     # Create log directory if it doesn't exist
@@ -57,6 +75,21 @@ def load_env_config(env_file: str = '.env') -> Dict[str, str]:
                     config[key] = value
     return config
 
+def json_dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to JSON bytes, using orjson when available (indent=True pretty-prints with 2 spaces)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS  # Stringify int keys like the json module does
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+def json_loads(content: Union[bytes, str]) -> Any:
+    """Parse a JSON response body or report file, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 def get_api_headers(token: str) -> Dict[str, str]:
     """Get API headers for HubSpot requests"""
     return {
@@ -64,6 +97,144 @@ def get_api_headers(token: str) -> Dict[str, str]:
         'Content-Type': 'application/json'
     }
 
+def create_hubspot_session(token: str, pool_size: int = 20) -> requests.Session:
+    """
+    Create a pooled HTTP session for one HubSpot portal
+    
+    Keeps TCP/TLS connections to api.hubapi.com alive across requests and
+    retries throttled or failed responses at the connection level.
+    
+    Args:
+        token: HubSpot Private App token used for every request
+        pool_size: Number of connections kept open in the pool
+        
+    Returns:
+        Configured requests.Session
+    """
+    session = _build_pooled_session(pool_size)
+    session.headers.update(get_api_headers(token))
+    
+    return session
+
+def _build_pooled_session(pool_size: int) -> requests.Session:
+    """Create a session with a keep-alive connection pool that retries only failed connects"""
+    session = requests.Session()
+    
+    # Only failed connection attempts are retried here, since nothing reached the server.
+    # Status codes (429/5xx) are retried by make_hubspot_request, where the rate limiter
+    # sees them, and requests that may have been sent (e.g. batch creates) are never re-sent.
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=0,
+        status=0,
+        other=0,
+        backoff_factor=0.5,
+        allowed_methods=frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS']),
+        raise_on_status=False  # Hand the final response back to make_hubspot_request
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    
+    return session
+
+def get_default_session() -> requests.Session:
+    """Get the shared session used when make_hubspot_request is called without one"""
+    global _default_session
+    
+    if _default_session is None:
+        with _default_session_lock:
+            if _default_session is None:
+                _default_session = _build_pooled_session(pool_size=32)
+    
+    return _default_session
+
+class RateLimiter:
+    """
+    Thread-safe token bucket for pacing HubSpot API requests
+    
+    Requests wait only as long as needed to stay under the configured rate.
+    The rate adapts AIMD-style: it is halved after a 429 or an overloaded
+    server response, held for a cooldown period, then raised back additively.
+    HubSpot's rate limit headers are also observed, pausing briefly when the
+    remaining quota for the current window runs low.
+    """
+    
+    def __init__(self, rate: float = 9.0, capacity: int = 9, penalty_seconds: float = 10.0,
+                 recovery_rate: float = 0.5):
+        self.rate = rate
+        self.capacity = capacity
+        self.penalty_seconds = penalty_seconds
+        self.recovery_rate = recovery_rate  # requests/s regained per second once the cooldown ends
+        self.tokens = float(capacity)
+        self._current_rate = rate
+        self._penalty_until = 0.0
+        self._paused_until = 0.0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        """Add tokens for the time elapsed since the last refill"""
+        elapsed = now - self._last_refill
+        
+        if self._current_rate < self.rate and now > self._penalty_until:
+            recovered = (now - max(self._last_refill, self._penalty_until)) * self.recovery_rate
+            self._current_rate = min(self.rate, self._current_rate + recovered)
+        
+        self.tokens = min(self.capacity, self.tokens + elapsed * self._current_rate)
+        self._last_refill = now
+    
+    def acquire(self):
+        """Block until a request token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                
+                if now < self._paused_until:
+                    wait_time = self._paused_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait_time = (1 - self.tokens) / self._current_rate
+            
+            time.sleep(wait_time)
+    
+    def penalize(self):
+        """Halve the request rate after a 429 or overload response (recovered gradually after the cooldown)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._current_rate = max(self._current_rate / 2, 0.5)
+            self._penalty_until = now + self.penalty_seconds
+            logging.warning("HubSpot is throttling or overloaded, reducing request rate to %.2f/s", self._current_rate)
+    
+    def observe(self, headers):
+        """Pause new requests when HubSpot reports the current window's quota is nearly used up"""
+        try:
+            remaining = int(headers['X-HubSpot-RateLimit-Remaining'])
+            limit = int(headers['X-HubSpot-RateLimit-Max'])
+            interval = int(headers['X-HubSpot-RateLimit-Interval-Milliseconds']) / 1000
+        except (KeyError, TypeError, ValueError):
+            return
+        
+        threshold = max(2, limit // 10)
+        if limit <= 0 or remaining > threshold:
+            return
+        
+        # Wait roughly as long as the window needs to free up the requests we are short by
+        pause = interval * (threshold - remaining + 1) / limit
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+
+def get_rate_limiter(token: str) -> RateLimiter:
+    """Get the rate limiter shared by every request made with this access token"""
+    with _rate_limiters_lock:
+        if token not in _rate_limiters:
+            _rate_limiters[token] = RateLimiter()
+        return _rate_limiters[token]
+
 def make_hubspot_request(
     method: str,
     url: str,
@@ -72,7 +243,9 @@ def make_hubspot_request(
     params: Optional[Dict[str, Any]] = None,
     max_retries: int = 3,
     timeout: int = 30,
-    backoff_factor: float = 2.0
+    backoff_factor: float = 2.0,
+    session: Optional[requests.Session] = None,
+    rate_limiter: Optional[RateLimiter] = None
 ) -> Tuple[bool, Union[Dict[str, Any], str]]:
     """
     Make a HubSpot API request with enhanced error handling and retries
@@ -86,30 +259,48 @@ def make_hubspot_request(
         max_retries: Maximum number of retry attempts
         timeout: Request timeout in seconds
         backoff_factor: Exponential backoff multiplier
+        session: Reusable session (see create_hubspot_session); a shared pooled session is used if omitted
+        rate_limiter: Limiter to pace every attempt, fed from HubSpot's rate limit headers
         
     Returns:
         Tuple of (success: bool, data: dict or error_info)
     """
     last_exception = None
+    body = None
+    if json_data is not None:
+        # Serialize once up front rather than on every retry
+        body = json_dumps(json_data)
+        if headers.get('Content-Type') != 'application/json':
+            headers = {**headers, 'Content-Type': 'application/json'}
+    
+    if session is None:
+        # Keep connections alive across calls instead of a fresh TLS handshake per request
+        session = get_default_session()
     
     for attempt in range(max_retries + 1):
         try:
-            # Add request session for connection pooling
-            session = requests.Session()
-            session.headers.update(headers)
+            if rate_limiter:
+                rate_limiter.acquire()
             
             response = session.request(
                 method=method,
                 url=url,
-                json=json_data,
+                headers=headers,
+                data=body,
                 params=params,
                 timeout=timeout
             )
             
+            if rate_limiter:
+                rate_limiter.observe(response.headers)
+                if response.status_code in (429, 502, 503):
+                    rate_limiter.penalize()
+            
             # Enhanced status code handling
-            if response.status_code in [200, 201, 202]:
+            # 207 is returned by batch endpoints when only some inputs failed
+            if response.status_code in [200, 201, 202, 207]:
                 try:
-                    return True, response.json()
+                    return True, json_loads(response.content)
                 except ValueError:
                     # Handle non-JSON responses
                     return True, {'status': 'success', 'text': response.text}
@@ -121,20 +312,20 @@ def make_hubspot_request(
             elif response.status_code == 409:
                 # Conflict - might be duplicate, return as success for some cases
                 try:
-                    return True, response.json()
+                    return True, json_loads(response.content)
                 except ValueError:
                     return True, {'status': 'conflict', 'text': response.text}
                     
             elif response.status_code == 429:
                 # Rate limited - enhanced backoff with jitter
                 if attempt < max_retries:
-                    retry_after = response.headers.get('Retry-After')
-                    if retry_after:
-                        sleep_time = min(int(retry_after), 300)  # Cap at 5 minutes
-                    else:
-                        sleep_time = min(backoff_factor ** attempt, 60)  # Cap at 1 minute
+                    try:
+                        sleep_time = min(float(response.headers['Retry-After']), 300)  # Cap at 5 minutes
+                    except (KeyError, TypeError, ValueError):
+                        # Missing or HTTP-date Retry-After, fall back to exponential backoff with jitter
+                        sleep_time = min(backoff_factor ** attempt + random.uniform(0, 1), 60)  # Cap at 1 minute
                     
-                    logging.warning(f"Rate limited, waiting {sleep_time}s before retry {attempt + 1}")
+                    logging.warning(f"Rate limited, waiting {sleep_time:.1f}s before retry {attempt + 1}")
                     time.sleep(sleep_time)
                     continue
                 else:
@@ -147,14 +338,14 @@ def make_hubspot_request(
             elif response.status_code in [500, 502, 503, 504]:
                 # Server errors - retry with backoff
                 if attempt < max_retries:
-                    sleep_time = min(backoff_factor ** attempt, 30)
-                    logging.warning(f"Server error {response.status_code}, retrying in {sleep_time}s")
+                    sleep_time = min(backoff_factor ** attempt + random.uniform(0, 1), 30)
+                    logging.warning(f"Server error {response.status_code}, retrying in {sleep_time:.1f}s")
                     time.sleep(sleep_time)
                     continue
                     
             # Client errors and other status codes
             try:
-                error_data = response.json()
+                error_data = json_loads(response.content)
             except ValueError:
                 error_data = response.text
                 
@@ -168,16 +359,18 @@ def make_hubspot_request(
         except requests.exceptions.Timeout as e:
             last_exception = e
             if attempt < max_retries:
-                sleep_time = min(backoff_factor ** attempt, 10)
-                logging.warning(f"Request timeout, retrying in {sleep_time}s")
+                sleep_time = min(backoff_factor ** attempt + random.uniform(0, 1), 10)
+                logging.warning(f"Request timeout, retrying in {sleep_time:.1f}s")
                 time.sleep(sleep_time)
                 continue
                 
         except requests.exceptions.ConnectionError as e:
             last_exception = e
+            if rate_limiter:
+                rate_limiter.penalize()
             if attempt < max_retries:
-                sleep_time = min(backoff_factor ** attempt, 10)
-                logging.warning(f"Connection error, retrying in {sleep_time}s")
+                sleep_time = min(backoff_factor ** attempt + random.uniform(0, 1), 10)
+                logging.warning(f"Connection error, retrying in {sleep_time:.1f}s")
                 time.sleep(sleep_time)
                 continue
                 